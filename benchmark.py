@@ -0,0 +1,193 @@
+# src/benchmark.py
+"""
+Kayıtlı oturumlarla headless benchmark.
+
+Kayıtlı kamera kliplerini eye_mouse_calibrated.main ile AYNI pipeline'dan geçirir
+(gerçek imleç yerine kaydeden bir hedef ile) ve sonuçları JSON olarak yazar:
+  • throughput (kare/s, sadece kare döngüsü), açılış süresi, aşama gecikmeleri
+    (p50/p95/p99), tepe RSS
+  • üretilen imleç yörüngesi ve tıklama olayları
+
+Kullanım:
+  python benchmark.py                              # ../data/bench altındaki klipler
+  python benchmark.py --clips klasor --out sonuc.json
+  python benchmark.py --compare onceki.json        # gerileme varsa çıkış kodu 1
+"""
+import argparse, json, os, platform, subprocess, sys, time
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing as mp
+
+from calibration_mapper import MODEL_NPZ_PATH
+from mouse_actuator import RecordingSink
+
+CLIPS_DIR = "../data/bench"
+
+# Senaryo → klip adı (uzantısız). Klasörde bulunanlar çalıştırılır.
+SCENARIOS = {
+    "head_motion":   "head_motion",     # baş hareketi
+    "blinks":        "blinks",          # tek kırpmalar
+    "double_blinks": "double_blinks",   # çift kırpma → tıklama
+    "low_light":     "low_light",       # zayıf ışık
+}
+CLIP_EXTS = (".mp4", ".avi", ".mkv", ".mov")
+
+
+def peak_rss_mb():
+    """Süreç tepe bellek kullanımı (MB); ölçülemiyorsa None."""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 1)
+    except ImportError:
+        pass
+    try:
+        import psutil
+        info = psutil.Process().memory_info()
+        return round(getattr(info, "peak_wset", info.rss) / (1024 * 1024), 1)
+    except ImportError:
+        return None
+
+
+def find_clips(clips_dir):
+    found = {}
+    for name, stem in SCENARIOS.items():
+        for ext in CLIP_EXTS:
+            path = os.path.join(clips_dir, stem + ext)
+            if os.path.isfile(path):
+                found[name] = path
+                break
+        else:
+            # resim klasörü olarak kaydedilmiş klip
+            path = os.path.join(clips_dir, stem)
+            if os.path.isdir(path):
+                found[name] = path
+    return found
+
+
+def run_clip(path, model_path=MODEL_NPZ_PATH, screen=(1920, 1080)):
+    """Tek klibi çalıştırır (ayrı süreçte çağrılır → tepe RSS klibe özel olur)."""
+    import eye_mouse_calibrated as eye_mouse
+    from frame_source import open_source
+
+    src = open_source(path, realtime=False)
+    sink = RecordingSink(lambda: src.frame_time)
+    snaps = []
+
+    t0 = time.perf_counter()
+    eye_mouse.main(
+        source=src,
+        realtime=False,
+        show_preview=False,
+        mouse_sink=sink,
+        threaded_output=False,   # yörünge kare zamanıyla birebir kaydedilsin
+        screen=screen,
+        model_path=model_path,
+        metrics_callback=snaps.append,
+        metrics_interval=3600.0,
+    )
+    wall = time.perf_counter() - t0
+
+    final = snaps[-1] if snaps else {}
+    frames = final.get("frames", 0)
+    # throughput sadece kare döngüsünden; model/FaceMesh açılışı ayrı raporlanır
+    loop = final.get("loop_s", 0.0)
+    return {
+        "clip": path,
+        "frames": frames,
+        "wall_s": round(wall, 3),
+        "loop_s": loop,
+        "startup_s": round(max(wall - loop, 0.0), 3),
+        "throughput_fps": round(frames / loop, 2) if loop > 0 else 0.0,
+        "stages_ms": final.get("stages", {}),
+        "total_ms": final.get("total", {}),
+        "peak_rss_mb": peak_rss_mb(),
+        "moves": sink.moves,
+        "clicks": sink.clicks,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(old, new, tolerance=0.10):
+    """
+    İki sonuç dosyasını karşılaştırır. Throughput %tolerance'tan fazla düştüyse
+    veya toplam p95 gecikme o kadar arttıysa gerileme sayılır.
+    """
+    regressions = []
+    for name, cur in new["scenarios"].items():
+        ref = old.get("scenarios", {}).get(name)
+        if not ref:
+            continue
+        fps_old, fps_new = ref["throughput_fps"], cur["throughput_fps"]
+        p95_old = ref["total_ms"].get("p95")
+        p95_new = cur["total_ms"].get("p95")
+        line = f"{name:14s} fps {fps_old:8.1f} → {fps_new:8.1f}"
+        if p95_old and p95_new:
+            line += f"   p95 {p95_old:7.2f} → {p95_new:7.2f} ms"
+        print(line)
+        if fps_new < fps_old * (1 - tolerance):
+            regressions.append(f"{name}: throughput {fps_old} → {fps_new}")
+        if p95_old and p95_new and p95_new > p95_old * (1 + tolerance):
+            regressions.append(f"{name}: p95 {p95_old} → {p95_new} ms")
+    return regressions
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Kayıtlı kliplerle headless göz-fare benchmark'ı")
+    ap.add_argument("--clips", default=CLIPS_DIR, help="klip klasörü")
+    ap.add_argument("--scenario", action="append", help="sadece bu senaryo(lar)")
+    ap.add_argument("--model", default=MODEL_NPZ_PATH, help="kalibrasyon katsayı dosyası (.npz)")
+    ap.add_argument("--out", default="../data/bench/results.json")
+    ap.add_argument("--compare", help="karşılaştırılacak önceki sonuç dosyası")
+    ap.add_argument("--tolerance", type=float, default=0.10)
+    args = ap.parse_args()
+
+    clips = find_clips(args.clips)
+    if args.scenario:
+        clips = {k: v for k, v in clips.items() if k in args.scenario}
+    if not clips:
+        print(f"❌ Klip bulunamadi: {args.clips} ({', '.join(SCENARIOS.values())})")
+        return 2
+
+    results = {
+        "commit": git_commit(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scenarios": {},
+    }
+    ctx = mp.get_context("spawn")
+    for name, path in clips.items():
+        print(f"▶ {name}: {path}")
+        with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as ex:
+            r = ex.submit(run_clip, path, args.model).result()
+        results["scenarios"][name] = r
+        print(f"  {r['frames']} kare, {r['throughput_fps']} kare/s (açılış {r['startup_s']} s), "
+              f"p95 {r['total_ms'].get('p95', '-')} ms, RSS {r['peak_rss_mb']} MB, "
+              f"{len(r['clicks'])} tık")
+
+    os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=1)
+    print(f"✅ Sonuçlar kaydedildi: {args.out}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            old = json.load(f)
+        regressions = compare(old, results, args.tolerance)
+        if regressions:
+            print("❌ Gerileme:\n  " + "\n  ".join(regressions))
+            return 1
+        print("✅ Gerileme yok.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
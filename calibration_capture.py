@@ -1,35 +1,61 @@
-import cv2, mediapipe as mp, numpy as np, time, pandas as pd, os
+import cv2, mediapipe as mp, numpy as np, time, os, argparse
+from collections import deque
 
-# Göz landmark indexleri
-LEFT_EYE  = [33,160,158,133,153,144]
-RIGHT_EYE = [263,387,385,362,380,373]
+from frame_source import open_source
+from landmarks import N_LANDMARKS, FEATURES, POSE_SLICE, landmarks_to_array, eye_points, iris_points, gaze_features
+from head_pose import HeadPose
+from calibration_store import CalibrationWriter, accept_partial, CALIB_PATH
+from calibration_targets import grid_targets, jittered_targets, TargetScheduler
 
 mp_face = mp.solutions.face_mesh
 
-def get_pts(lmk, w, h, idxs):
-    return np.array([[lmk[i].x*w, lmk[i].y*h] for i in idxs], dtype=np.float32)
+# Kaydedilen sütunlar (ekran hedefi her hedef parçasının başlığında)
+COLUMNS = ("t",) + FEATURES
 
 # --- 3x3 Kalibrasyon hedefleri ---
 def get_targets(sw, sh):
-    xs = [0.15, 0.5, 0.85]
-    ys = [0.15, 0.5, 0.85]
-    targets = []
-    for y in ys:
-        for x in xs:
-            targets.append((int(sw * x), int(sh * y)))
-    return targets
-
-def main(samples_per_point=40, delay=2.0):
+    return grid_targets(sw, sh, 3, 3)
+
+# --- Hedefe oturma kontrolü ---
+SETTLE_FRAMES = 8        # son bu kadar karede
+SETTLE_IRIS = 0.03       # iris (göz genişliği biriminde) bu kadardan az oynuyorsa göz oturmuştur
+MIN_SETTLE = 0.4         # hedef göründükten sonra en az bu kadar s bekle (sakkad + tepki)
+
+def main(samples_per_point=40, delay=2.0, source=0, grid=(3, 3), randomize=False,
+         adaptive=False, max_targets=25, target_error_px=60.0, time_budget=120.0, keep_partial=False):
+    """
+    keep_partial: 'q' / kamera kaybında yarım oturum yine de asıl dosyanın yerine geçsin mi?
+        (varsayılan: hayır → önceki kalibrasyon dosyası korunur, yarım kayıt .partial'da kalır)
+    grid: (sütun, satır) başlangıç ızgarası; randomize: hücre içinde kaydırılmış + karışık sıra.
+    adaptive: ilk turdan sonra hatanın yüksek olduğu bölgelere hedef ekle.
+    delay: göz oturmazsa bir hedefte en fazla bu kadar s beklenir.
+    """
     sw, sh = 1920, 1080  # ekran çözünürlüğü
 
-    save_path = "../data/raw/calibration.csv"
-    os.makedirs(os.path.dirname(save_path), exist_ok=True)
-
-    cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-
-    data = []
+    save_path = CALIB_PATH
+
+    cap = open_source(source, width=640, height=480)
+    cam_w = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH) or 640)
+    cam_h = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT) or 480)
+
+    cols, nrows = grid
+    targets = jittered_targets(sw, sh, cols, nrows) if randomize else grid_targets(sw, sh, cols, nrows)
+    sched = TargetScheduler(sw, sh, targets, adaptive=adaptive, max_targets=max_targets,
+                            target_error_px=target_error_px, time_budget=time_budget)
+
+    # Örnekler hedef hedef diske yazılır; bellekte sadece bir hedeflik tampon tutulur
+    if os.path.exists(save_path + ".partial"):
+        print(f"⚠️ Önceki yarım oturum ({save_path}.partial) bu oturumla değiştirilecek "
+              f"(saklamak için önce --accept-partial).")
+    writer = CalibrationWriter(save_path, COLUMNS, screen=(sw, sh), camera=(cam_w, cam_h),
+                               grid=list(grid), randomize=randomize, adaptive=adaptive)
+    rows = np.zeros((samples_per_point, len(COLUMNS)), dtype=np.float32)
+    lm_buf = np.zeros((N_LANDMARKS, 3), dtype=np.float32)
+    feat = np.zeros(len(FEATURES))
+    head = HeadPose(cam_w, cam_h)
+    iris_cols = slice(FEATURES.index("iris_x"), FEATURES.index("iris_y") + 1)
+    recent = deque(maxlen=SETTLE_FRAMES)
+    t0 = time.time()   # "t" sütunu oturum başından itibaren saniye (float32 hassasiyeti için)
 
     # --- Fullscreen pencere ---
     cv2.namedWindow("Calibration", cv2.WINDOW_NORMAL)
@@ -40,9 +66,18 @@ def main(samples_per_point=40, delay=2.0):
     )
 
     with mp_face.FaceMesh(max_num_faces=1, refine_landmarks=True) as fm:
-        for tx, ty in get_targets(sw, sh):
+        ok = True
+        while ok:
+            target = sched.next_target()
+            if target is None:
+                break
+            tx, ty = target
             print(f"👉 Bu noktaya bak: ({tx}, {ty})")
-            time.sleep(delay)
+
+            # Kör bekleme yerine: hedef gösterilir, bakış durulunca (veya delay dolunca) toplanır
+            shown = time.monotonic()
+            settled = False
+            recent.clear()
 
             count = 0
             while count < samples_per_point:
@@ -57,33 +92,75 @@ def main(samples_per_point=40, delay=2.0):
 
                 if res.multi_face_landmarks:
                     lm = res.multi_face_landmarks[0].landmark
-                    L = get_pts(lm, w, h, LEFT_EYE)
-                    R = get_pts(lm, w, h, RIGHT_EYE)
-                    gaze = np.vstack((L, R)).mean(axis=0)
-
-                    data.append([gaze[0], gaze[1], tx, ty])
-                    count += 1
-
-                # --- Kırmızı hedef nokta (tam ekran oranlı) ---
+                    pts = landmarks_to_array(lm, w, h, lm_buf)
+                    eyes = eye_points(pts)              # (2,6,2): sol, sağ
+                    gaze_features(eyes, iris_points(pts), feat)   # göz konumları + iris
+                    gaze = feat[iris_cols]              # göz dönüşü
+                    posed = head.estimate(pts, feat[POSE_SLICE])
+
+                    if settled and posed:
+                        rows[count, 0] = time.time() - t0
+                        rows[count, 1:] = feat
+                        count += 1
+                    else:
+                        recent.append(gaze.copy())
+                        waited = time.monotonic() - shown
+                        steady = (len(recent) == SETTLE_FRAMES and
+                                  np.ptp(np.array(recent), axis=0).max() < SETTLE_IRIS)
+                        settled = waited >= delay or (waited >= MIN_SETTLE and steady)
+                else:
+                    head.reset()
+
+                # --- Kırmızı hedef nokta (tam ekran oranlı); oturana kadar içi boş ---
                 draw_x = int(tx / sw * w)
                 draw_y = int(ty / sh * h)
-                cv2.circle(frame, (draw_x, draw_y), 15, (0, 0, 255), -1)
+                cv2.circle(frame, (draw_x, draw_y), 15, (0, 0, 255), -1 if settled else 3)
 
                 cv2.imshow("Calibration", frame)
                 if cv2.waitKey(1) & 0xFF == ord("q"):
-                    cap.release()
-                    cv2.destroyAllWindows()
-                    return
+                    # O ana kadar toplanan hedefler (bu hedef dahil, aşağıda) .partial dosyasında kalır
+                    ok = False
+                    break
+
+            if count:
+                writer.write_target(tx, ty, rows[:count])
+                sched.add(tx, ty, rows[:count, 1:][:, iris_cols])   # iris_x, iris_y
+            if sched.errors is not None:
+                print(f"   hedef hatası (px): ort {sched.errors.mean():.0f}, en kötü {sched.errors.max():.0f}")
 
     cap.release()
     cv2.destroyAllWindows()
-
-    df = pd.DataFrame(
-        data,
-        columns=["eye_x", "eye_y", "screen_x", "screen_y"]
-    )
-    df.to_csv(save_path, index=False)
-    print(f"✅ Kalibrasyon verisi kaydedildi: {save_path}")
+    if ok or (keep_partial and writer.targets):
+        writer.commit()
+        mark = "✅" if ok else "⚠️ Yarım oturum kabul edildi;"
+        print(f"{mark} Kalibrasyon verisi kaydedildi: {save_path} ({writer.targets} hedef, {writer.rows} örnek)")
+    else:
+        writer.close()
+        print(f"⚠️ Yarıda kesildi; önceki {save_path} korundu. "
+              f"{writer.targets} hedef {writer.partial_path} dosyasında (kabul için --accept-partial).")
 
 if __name__ == "__main__":
-    main()
+    ap = argparse.ArgumentParser(description="Göz → ekran kalibrasyon verisi toplama")
+    ap.add_argument("--grid", default="3x3", help="başlangıç ızgarası, SÜTUNxSATIR (ör. 5x4)")
+    ap.add_argument("--samples", type=int, default=40, help="hedef başına örnek")
+    ap.add_argument("--random", action="store_true", help="hücre içinde kaydırılmış, karışık sıralı hedefler")
+    ap.add_argument("--adaptive", action="store_true", help="hatalı bölgelere hedef ekle")
+    ap.add_argument("--max-targets", type=int, default=25)
+    ap.add_argument("--target-error", type=float, default=60.0, help="hedef hata eşiği (px)")
+    ap.add_argument("--budget", type=float, default=120.0, help="adaptif süre bütçesi (s)")
+    ap.add_argument("--keep-partial", action="store_true",
+                    help="yarıda kesilen oturum da kalibrasyon dosyasının yerine geçsin")
+    ap.add_argument("--accept-partial", action="store_true",
+                    help="kayıt yapmadan, önceki yarım oturumu (.partial) kalibrasyon dosyası olarak kabul et")
+    args = ap.parse_args()
+    if args.accept_partial:
+        try:
+            n = accept_partial(CALIB_PATH)
+        except (OSError, ValueError) as e:
+            raise SystemExit(f"❌ Yarım oturum kabul edilemedi: {e}")
+        print(f"✅ Yarım oturum kabul edildi: {CALIB_PATH} ({n} hedef)")
+    else:
+        gc, gr = (int(v) for v in args.grid.lower().split("x"))
+        main(samples_per_point=args.samples, grid=(gc, gr), randomize=args.random, adaptive=args.adaptive,
+             max_targets=args.max_targets, target_error_px=args.target_error, time_budget=args.budget,
+             keep_partial=args.keep_partial)
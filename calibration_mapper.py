@@ -0,0 +1,97 @@
+# src/calibration_mapper.py
+from itertools import combinations_with_replacement
+import numpy as np
+
+# Kalibrasyon modelinin sklearn/joblib gerektirmeyen çalışma zamanı karşılığı.
+# Dosya: .npz → coef (m,2), degree, inputs, mean, scale
+#   screen = poly_terms((x - mean) / scale) @ coef
+
+MODEL_NPZ_PATH = "../data/models/calibration_model.npz"
+
+
+def poly_terms(d, degree):
+    """
+    d girişli, en fazla `degree` dereceli tüm monomlar.
+    Her terim `degree` uzunluğunda indeks demeti; d indeksi sabit 1'i gösterir.
+      d=2, degree=1 → [(2,), (0,), (1,)]  = [1, x0, x1]
+    """
+    terms = []
+    for k in range(degree + 1):
+        for combo in combinations_with_replacement(range(d), k):
+            terms.append(combo + (d,) * (degree - k))
+    return np.array(terms, dtype=np.intp).reshape(len(terms), degree)
+
+
+class CalibrationMapper:
+    """
+    (göz özellikleri) → (ekran x, y) eşlemesi.
+    predict() kare başına çağrılır: tüm ara diziler önceden ayrılır, yeni nesne üretilmez.
+    """
+
+    def __init__(self, coef, degree=1, inputs=("eye_x", "eye_y"), mean=None, scale=None):
+        self.inputs = tuple(str(c) for c in inputs)
+        self.degree = int(degree)
+        d = len(self.inputs)
+        self.terms = poly_terms(d, self.degree)
+        self.coef = np.ascontiguousarray(coef, dtype=np.float64)
+        if self.coef.shape != (len(self.terms), 2):
+            raise ValueError(f"coef şekli {self.coef.shape}, beklenen {(len(self.terms), 2)}")
+        self.mean = np.zeros(d) if mean is None else np.asarray(mean, dtype=np.float64)
+        self.scale = np.ones(d) if scale is None else np.asarray(scale, dtype=np.float64)
+
+        # --- Kare başına kullanılan tamponlar ---
+        self._x = np.ones(d + 1)                              # son eleman sabit 1
+        self._g = np.empty(self.terms.shape)                  # terim çarpanları
+        self._phi = np.empty(len(self.terms))                 # özellik vektörü
+        self._out = np.empty(2)
+
+    # ----------------- Dosya -----------------
+    @classmethod
+    def load(cls, path=MODEL_NPZ_PATH):
+        with np.load(path, allow_pickle=False) as z:
+            return cls(z["coef"], int(z["degree"]), z["inputs"], z["mean"], z["scale"])
+
+    def save(self, path=MODEL_NPZ_PATH):
+        np.savez(
+            path, coef=self.coef, degree=self.degree,
+            inputs=np.array(self.inputs), mean=self.mean, scale=self.scale,
+        )
+
+    @classmethod
+    def fit(cls, X, Y, degree=1, inputs=("eye_x", "eye_y")):
+        """En küçük kareler (NumPy): X (n,d) özellikler, Y (n,2) ekran noktaları."""
+        X = np.asarray(X, dtype=np.float64)
+        mean = X.mean(axis=0)
+        scale = X.std(axis=0)
+        scale[scale == 0] = 1.0
+        m = cls(np.zeros((len(poly_terms(X.shape[1], degree)), 2)), degree, inputs, mean, scale)
+        m.coef[:] = np.linalg.lstsq(m.design(X), np.asarray(Y, dtype=np.float64), rcond=None)[0]
+        return m
+
+    @classmethod
+    def from_sklearn(cls, model, inputs=("eye_x", "eye_y")):
+        """Eğitilmiş LinearRegression → afin eşleyici (coef: [intercept; coef_.T])."""
+        coef = np.vstack([np.atleast_2d(model.intercept_), np.asarray(model.coef_).T])
+        return cls(coef, 1, inputs)
+
+    # ----------------- Tahmin -----------------
+    def design(self, X):
+        """(n,d) girişlerden (n,m) özellik matrisi (eğitim/değerlendirme için)."""
+        X = (np.asarray(X, dtype=np.float64) - self.mean) / self.scale
+        Xe = np.hstack([X, np.ones((len(X), 1))])
+        return np.prod(Xe[:, self.terms], axis=2)
+
+    def predict_many(self, X):
+        return self.design(X) @ self.coef
+
+    def phi(self, x):
+        """Tek örneğin (m,) özellik vektörü; dönen tampon bir sonraki çağrıda üzerine yazılır."""
+        xs = self._x[:-1]
+        np.subtract(x, self.mean, out=xs)
+        np.divide(xs, self.scale, out=xs)
+        np.take(self._x, self.terms, out=self._g)
+        return np.prod(self._g, axis=1, out=self._phi)
+
+    def predict(self, x):
+        """Tek örnek; dönen (2,) tampon bir sonraki çağrıda üzerine yazılır."""
+        return np.dot(self.phi(x), self.coef, out=self._out)
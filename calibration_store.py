@@ -0,0 +1,150 @@
+# src/calibration_store.py
+import json, os, struct, time
+import numpy as np
+
+# Kalibrasyon örnekleri için ekleme dostu ikili dosya.
+#
+#   dosya başlığı : b"EYECAL01" + uint32 uzunluk + oturum başlığı (UTF-8 JSON)
+#                   {"screen": [sw, sh], "camera": [w, h], "time": ..., "columns": [...]}
+#   hedef parçası : b"TG" + uint16 hedef no + int32 tx, ty + uint32 satır + uint32 sütun
+#                   + float32[satır × sütun]
+#
+# Her hedef bitince parçası yazılıp diske gönderilir; oturum yarıda kesilirse (çökme, 'q')
+# o ana kadar tamamlanan hedefler korunur. Son parça yarım kalmışsa okurken atlanır.
+# Oturum önce `<yol>.partial` dosyasına yazılır; asıl dosya sadece commit() ile (oturum
+# tamamlanınca ya da yarım oturum açıkça kabul edilince) değiştirilir → önceki iyi oturum
+# yarıda kalan bir kayıtla ezilmez. Yeni oturum aynı .partial dosyasını baştan yazar;
+# önceki yarım oturum gerekiyorsa önce accept_partial() ile kabul edilmelidir.
+
+CALIB_PATH = "../data/raw/calibration.cal"
+LEGACY_CSV_PATH = "../data/raw/calibration.csv"
+
+MAGIC = b"EYECAL01"
+CHUNK_TAG = b"TG"
+_CHUNK = struct.Struct("<2sHiiII")
+
+
+class CalibrationWriter:
+    """
+    with CalibrationWriter(path, columns, screen=(sw, sh), camera=(w, h)) as w:
+        w.write_target(tx, ty, rows)   # rows: (n, len(columns)) float32
+        w.commit()                     # yoksa path değişmez, kayıt path + ".partial" içinde kalır
+    """
+
+    def __init__(self, path, columns, screen, camera, **meta):
+        self.path = path
+        self.partial_path = path + ".partial"
+        self.columns = list(columns)
+        self.targets = 0
+        self.rows = 0
+        header = dict(
+            screen=list(screen), camera=list(camera),
+            time=time.strftime("%Y-%m-%dT%H:%M:%S"), columns=self.columns, **meta
+        )
+        blob = json.dumps(header, ensure_ascii=False).encode("utf-8")
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._f = open(self.partial_path, "wb")
+        self._f.write(MAGIC + struct.pack("<I", len(blob)) + blob)
+        self._sync()
+
+    def _sync(self):
+        self._f.flush()
+        os.fsync(self._f.fileno())
+
+    def write_target(self, tx, ty, rows):
+        rows = np.ascontiguousarray(rows, dtype="<f4")
+        if rows.ndim != 2 or rows.shape[1] != len(self.columns):
+            raise ValueError(f"Satır şekli {rows.shape}, beklenen (n, {len(self.columns)})")
+        self._f.write(_CHUNK.pack(CHUNK_TAG, self.targets, int(tx), int(ty), rows.shape[0], rows.shape[1]))
+        self._f.write(rows.tobytes())
+        self._sync()
+        self.targets += 1
+        self.rows += rows.shape[0]
+
+    def close(self):
+        """Dosyayı kapatır; asıl dosyaya dokunmaz (yarım oturum .partial olarak kalır)."""
+        if not self._f.closed:
+            self._f.close()
+
+    def commit(self):
+        """Oturumu kapatıp asıl dosyanın yerine koyar (atomik)."""
+        self.close()
+        os.replace(self.partial_path, self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def accept_partial(path=CALIB_PATH):
+    """
+    Yarıda kalan oturumu (path + ".partial") asıl dosyanın yerine koyar (atomik) → hedef sayısı.
+    Dosya okunamıyorsa ya da tamamlanmış hedef yoksa asıl dosyaya dokunulmaz.
+    """
+    partial = path + ".partial"
+    _, data = read_calibration(partial)
+    n = len(np.unique(data["target"]))
+    if n == 0:
+        raise ValueError(f"{partial} içinde tamamlanmış hedef yok")
+    os.replace(partial, path)
+    return n
+
+
+def read_calibration(path=CALIB_PATH):
+    """
+    → (oturum başlığı, veriler). veriler: sütun adı → np.ndarray; ayrıca
+    "target" (hedef no), "screen_x", "screen_y".
+    """
+    with open(path, "rb") as f:
+        buf = f.read()
+    if buf[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"Kalibrasyon dosyası değil: {path}")
+    pos = len(MAGIC)
+    (n,) = struct.unpack_from("<I", buf, pos)
+    pos += 4
+    header = json.loads(buf[pos:pos + n].decode("utf-8"))
+    pos += n
+
+    ncols = len(header["columns"])
+    blocks, target, sx, sy = [], [], [], []
+    while pos + _CHUNK.size <= len(buf):
+        tag, idx, tx, ty, rows, cols = _CHUNK.unpack_from(buf, pos)
+        end = pos + _CHUNK.size + 4 * rows * cols
+        if tag != CHUNK_TAG or cols != ncols or end > len(buf):
+            break   # yarım kalmış son parça
+        blocks.append(np.frombuffer(buf, "<f4", rows * cols, pos + _CHUNK.size).reshape(rows, cols))
+        target.append(np.full(rows, idx, dtype=np.int32))
+        sx.append(np.full(rows, tx, dtype=np.float32))
+        sy.append(np.full(rows, ty, dtype=np.float32))
+        pos = end
+
+    table = np.concatenate(blocks) if blocks else np.zeros((0, ncols), np.float32)
+    data = {c: table[:, i] for i, c in enumerate(header["columns"])}
+    data["target"] = np.concatenate(target) if target else np.zeros(0, np.int32)
+    data["screen_x"] = np.concatenate(sx) if sx else np.zeros(0, np.float32)
+    data["screen_y"] = np.concatenate(sy) if sy else np.zeros(0, np.float32)
+    return header, data
+
+
+def read_legacy_csv(path=LEGACY_CSV_PATH):
+    """Eski calibration.csv (eye_x, eye_y, screen_x, screen_y) → read_calibration ile aynı biçim."""
+    with open(path, encoding="utf-8") as f:
+        columns = f.readline().strip().split(",")
+    table = np.loadtxt(path, delimiter=",", skiprows=1, ndmin=2, dtype=np.float32)
+    data = {c: table[:, i] for i, c in enumerate(columns)}
+    # hedef numarası: aynı ekran noktası = aynı hedef
+    _, data["target"] = np.unique(table[:, [columns.index("screen_x"), columns.index("screen_y")]],
+                                  axis=0, return_inverse=True)
+    data["target"] = data["target"].reshape(-1).astype(np.int32)
+    return {"columns": [c for c in columns if not c.startswith("screen_")]}, data
+
+
+def load_samples(path=CALIB_PATH, legacy_path=LEGACY_CSV_PATH):
+    """Yeni biçim varsa onu, yoksa eski CSV'yi okur; ikisi de yoksa None."""
+    if os.path.isfile(path):
+        return read_calibration(path)
+    if legacy_path and os.path.isfile(legacy_path):
+        return read_legacy_csv(legacy_path)
+    return None
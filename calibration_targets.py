@@ -0,0 +1,108 @@
+# src/calibration_targets.py
+import time
+import numpy as np
+
+from calibration_mapper import CalibrationMapper
+
+# Kalibrasyon hedef noktaları ve hedef sırası.
+#   • grid_targets     → N×M düzenli ızgara
+#   • jittered_targets → her hücrede rastgele kaydırılmış, karışık sıralı ızgara
+#   • TargetScheduler  → önce verilen hedefler; adaptive=True ise sonra modeli kurar,
+#                        hatanın en yüksek olduğu bölgelere hedef ekler (hata eşiğin altına
+#                        inene, hedef sayısı veya süre bütçesi dolana kadar)
+
+
+def _axis(n, margin):
+    return [0.5] if n == 1 else list(np.linspace(margin, 1 - margin, n))
+
+
+def grid_targets(sw, sh, cols=3, rows=3, margin=0.15):
+    """Satır satır N×M ızgara (piksel)."""
+    return [(int(sw * x), int(sh * y)) for y in _axis(rows, margin) for x in _axis(cols, margin)]
+
+
+def jittered_targets(sw, sh, cols=3, rows=3, margin=0.15, jitter=0.35, seed=None):
+    """
+    Izgara hücrelerinin her birinde rastgele kaydırılmış bir nokta, karışık sırada.
+    jitter: hücre boyunun oranı (0 → düzenli ızgara).
+    """
+    rng = np.random.default_rng(seed)
+    cw = (1 - 2 * margin) / max(cols - 1, 1)
+    ch = (1 - 2 * margin) / max(rows - 1, 1)
+    pts = []
+    for y in _axis(rows, margin):
+        for x in _axis(cols, margin):
+            jx = np.clip(x + rng.uniform(-jitter, jitter) * cw, margin / 2, 1 - margin / 2)
+            jy = np.clip(y + rng.uniform(-jitter, jitter) * ch, margin / 2, 1 - margin / 2)
+            pts.append((int(sw * jx), int(sh * jy)))
+    rng.shuffle(pts)
+    return pts
+
+
+class TargetScheduler:
+    """
+    next_target() → (tx, ty) veya None (bitti); add(tx, ty, X) → hedefte toplanan (n,2) özellikler.
+
+    Adaptif aşamada her hedef sonrası model, o hedef hariç tutularak (leave-one-target-out)
+    yeniden kurulur; hedef başına piksel hatası bulunur. Aday noktalar (ince ızgara) çevre
+    hedeflerin hatasıyla (ters uzaklık ağırlıklı) puanlanır; mevcut hedeflere yakın adaylar
+    cezalandırılır. En yüksek puanlı aday bir sonraki hedef olur.
+    """
+
+    def __init__(self, sw, sh, targets, adaptive=False, max_targets=25,
+                 target_error_px=60.0, time_budget=120.0, margin=0.1, candidates=(12, 8)):
+        self.sw, self.sh = sw, sh
+        self.queue = list(targets)
+        self.adaptive = adaptive
+        self.max_targets = max_targets
+        self.target_error_px = target_error_px
+        self.time_budget = time_budget
+        cx = np.linspace(margin, 1 - margin, candidates[0]) * sw
+        cy = np.linspace(margin, 1 - margin, candidates[1]) * sh
+        self.candidates = np.array([(x, y) for y in cy for x in cx])
+        self.spacing = np.hypot(sw, sh) / np.hypot(*candidates)
+        self.done = []          # [(tx, ty, X), ...]
+        self.errors = None      # son hedef başına hata (px)
+        self._t0 = None
+
+    def add(self, tx, ty, X):
+        if len(X):
+            self.done.append((tx, ty, np.asarray(X, dtype=np.float64)))
+
+    def next_target(self):
+        if self._t0 is None:
+            self._t0 = time.monotonic()
+        if self.queue:
+            return self.queue.pop(0)
+        if not self.adaptive or len(self.done) >= self.max_targets:
+            return None
+        if time.monotonic() - self._t0 > self.time_budget:
+            return None
+        self.errors = self.target_errors()
+        if self.errors is None or self.errors.max() < self.target_error_px:
+            return None
+        return self._pick()
+
+    def target_errors(self):
+        """Hedef başına leave-one-target-out ortalama piksel hatası (yetersiz veride None)."""
+        n = len(self.done)
+        if n < 4:
+            return None
+        degree = 2 if n >= 8 else 1
+        errs = np.empty(n)
+        for i, (tx, ty, X) in enumerate(self.done):
+            rest = [d for j, d in enumerate(self.done) if j != i]
+            Xr = np.vstack([d[2] for d in rest])
+            Yr = np.vstack([np.tile((d[0], d[1]), (len(d[2]), 1)) for d in rest])
+            m = CalibrationMapper.fit(Xr, Yr, degree)
+            errs[i] = np.hypot(*(m.predict_many(X) - (tx, ty)).T).mean()
+        return errs
+
+    def _pick(self):
+        pts = np.array([(d[0], d[1]) for d in self.done], dtype=np.float64)
+        dist = np.hypot(*(self.candidates[:, None, :] - pts[None, :, :]).transpose(2, 0, 1))
+        w = 1.0 / (dist ** 2 + 1.0)
+        local_err = (w * self.errors).sum(axis=1) / w.sum(axis=1)
+        score = local_err * np.minimum(dist.min(axis=1) / self.spacing, 1.0)
+        x, y = self.candidates[int(np.argmax(score))]
+        return int(x), int(y)
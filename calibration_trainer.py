@@ -0,0 +1,101 @@
+# src/calibration_trainer.py
+import numpy as np
+
+from calibration_mapper import CalibrationMapper, poly_terms
+
+# Bağımlılıksız kalibrasyon eğitimi (sadece NumPy).
+# Aday özellik eşlemeleri kapalı form en küçük karelerle kurulur; seçim, HEDEF bazında
+# k-katlı çapraz doğrulama ile yapılır (bir hedefin tüm örnekleri aynı katta → model
+# hiç görmediği ekran noktalarında ölçülür). Tüm adaylar milisaniyeler içinde biter.
+
+# ad → (girişler, derece)
+FEATURE_MAPS = {
+    "affine":        (("eye_x", "eye_y"), 1),
+    "poly2":         (("eye_x", "eye_y"), 2),
+    "poly3":         (("eye_x", "eye_y"), 3),
+    "per_eye":       (("left_x", "left_y", "right_x", "right_y"), 1),
+    "per_eye_poly2": (("left_x", "left_y", "right_x", "right_y"), 2),
+    # iris-göz çerçevesi (göz dönüşü); *_head → göz konumu (baş hareketi) ile birlikte
+    "iris":          (("iris_x", "iris_y"), 1),
+    "iris_poly2":    (("iris_x", "iris_y"), 2),
+    "per_iris":      (("left_iris_x", "left_iris_y", "right_iris_x", "right_iris_y"), 1),
+    "iris_head":     (("iris_x", "iris_y", "eye_x", "eye_y"), 1),
+    "iris_head_poly2": (("iris_x", "iris_y", "eye_x", "eye_y"), 2),
+    # baş pozu (solvePnP): kalibrasyondan sonraki baş dönüşü/kayması modele girer
+    "iris_pose":     (("iris_x", "iris_y", "yaw", "pitch", "head_x", "head_y"), 1),
+    "iris_pose_full": (("iris_x", "iris_y", "yaw", "pitch", "roll", "head_x", "head_y", "head_z"), 1),
+}
+
+
+def _xy(data, inputs, rows=slice(None)):
+    X = np.column_stack([data[c][rows] for c in inputs]).astype(np.float64)
+    Y = np.column_stack([data["screen_x"][rows], data["screen_y"][rows]]).astype(np.float64)
+    return X, Y
+
+
+def fit_map(data, name, rows=slice(None)):
+    inputs, degree = FEATURE_MAPS[name]
+    X, Y = _xy(data, inputs, rows)
+    return CalibrationMapper.fit(X, Y, degree, inputs)
+
+
+def target_folds(target, k=5, seed=0):
+    """Hedef numaralarını k kata böler → her kat için test satırı maskesi."""
+    ids = np.unique(target)
+    rng = np.random.default_rng(seed)
+    rng.shuffle(ids)
+    return [np.isin(target, fold) for fold in np.array_split(ids, min(k, len(ids)))]
+
+
+def cross_validate(data, name, k=5):
+    """
+    Hedef bazında k-katlı CV → örnek başına piksel hatası (n,).
+    Eğitim katlarındaki hedef sayısı modelin terim sayısından azsa None (belirsiz model).
+    """
+    inputs, degree = FEATURE_MAPS[name]
+    n_terms = len(poly_terms(len(inputs), degree))
+    target = data["target"]
+    err = np.empty(len(target))
+    for test in target_folds(target, k):
+        if len(np.unique(target[~test])) < n_terms:
+            return None
+        m = fit_map(data, name, ~test)
+        X, Y = _xy(data, inputs, test)
+        err[test] = np.hypot(*(m.predict_many(X) - Y).T)
+    return err
+
+
+def per_target_error(data, err):
+    """→ [(hedef, screen_x, screen_y, ortalama hata px), ...]"""
+    out = []
+    for t in np.unique(data["target"]):
+        sel = data["target"] == t
+        out.append((int(t), float(data["screen_x"][sel][0]), float(data["screen_y"][sel][0]),
+                    float(err[sel].mean())))
+    return out
+
+
+def select_model(data, k=5, candidates=None):
+    """
+    Adayları CV ile karşılaştırır, en iyisini tüm veriyle yeniden kurar.
+    → (ad, CalibrationMapper, rapor). rapor[ad] = {"cv_px", "p90_px", "targets": per_target_error}
+    Ölçüt: hedef başına ortalama hatanın ortalaması (çok örnekli hedefler baskın olmasın).
+    """
+    names = [n for n in (candidates or FEATURE_MAPS) if all(c in data for c in FEATURE_MAPS[n][0])]
+    report = {}
+    for name in names:
+        err = cross_validate(data, name, k)
+        if err is None:
+            continue
+        targets = per_target_error(data, err)
+        report[name] = {
+            "cv_px": float(np.mean([t[3] for t in targets])),
+            "p90_px": float(np.percentile(err, 90)),
+            "targets": targets,
+        }
+    if not report:
+        # CV için hedef yetersiz: en basit model
+        name = "affine"
+    else:
+        name = min(report, key=lambda n: report[n]["cv_px"])
+    return name, fit_map(data, name), report
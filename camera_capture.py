@@ -0,0 +1,99 @@
+# src/camera_capture.py
+import threading
+import cv2
+import numpy as np
+
+
+class CameraCapture:
+    """
+    Kamerayı ayrı bir thread'de okur:
+      • Kareler önceden ayrılmış küçük bir halka tampona (ring buffer) yazılır
+      • read() her zaman en yeni kareyi döndürür, arada kaçanları sayar
+      • İşleme döngüsü yavaşlasa bile sürücü kuyruğunda eski kare birikmez
+    """
+
+    def __init__(self, cap, width=640, height=480, slots=3):
+        if slots < 3:
+            raise ValueError("slots en az 3 olmalı (yazılan + en yeni + okunan)")
+        self.cap = cap
+        # Thread başlamadan önce ayarla; sonra cap'e sadece okuma thread'i dokunur
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        self._ring = [np.zeros((height, width, 3), dtype=np.uint8) for _ in range(slots)]
+        self._seq = [0] * slots
+
+        self._cond = threading.Condition()
+        self._latest = -1         # en son yazılan slot
+        self._held = -1           # okuyucunun elindeki slot
+        self._write_seq = 0
+        self._read_seq = 0
+        self._eof = False
+        self._stop = False
+
+        self.frames_captured = 0
+        self.frames_dropped = 0
+
+        self._thread = threading.Thread(target=self._run, name="CameraCapture", daemon=True)
+        self._thread.start()
+
+    # ----------------- Yakalama thread'i -----------------
+    def _free_slot(self):
+        for i in range(len(self._ring)):
+            if i != self._latest and i != self._held:
+                return i
+        return -1
+
+    def _run(self):
+        while not self._stop:
+            with self._cond:
+                slot = self._free_slot()
+            buf = self._ring[slot]
+
+            ok, frame = self.cap.read(buf)
+            if not ok or frame is None:
+                break
+            if frame is not buf:
+                # Çözünürlük istenenden farklıysa slotu bir kez yeniden boyutla
+                if frame.shape != buf.shape:
+                    buf = self._ring[slot] = np.empty_like(frame)
+                np.copyto(buf, frame)
+
+            with self._cond:
+                self._write_seq += 1
+                self._seq[slot] = self._write_seq
+                self._latest = slot
+                self.frames_captured += 1
+                self._cond.notify()
+
+        with self._cond:
+            self._eof = True
+            self._cond.notify_all()
+
+    # ----------------- Okuyucu tarafı -----------------
+    def read(self, timeout=5.0):
+        """
+        cv2.VideoCapture.read ile aynı imza: (ok, frame).
+        Dönen kare bir sonraki read() çağrısına kadar geçerlidir.
+        """
+        with self._cond:
+            while self._latest < 0 or self._seq[self._latest] <= self._read_seq:
+                if self._eof or self._stop:
+                    return False, None
+                if not self._cond.wait(timeout):
+                    return False, None
+
+            slot = self._latest
+            seq = self._seq[slot]
+            if self._read_seq:
+                self.frames_dropped += seq - self._read_seq - 1
+            self._read_seq = seq
+            self._held = slot
+        return True, self._ring[slot]
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def release(self):
+        self._stop = True
+        self._thread.join(timeout=2.0)
+        self.cap.release()
@@ -1,9 +1,8 @@
 import cv2
 
-cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
-cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))  # MJPG formatı zorunlu
-cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+from frame_source import open_source
+
+cap = open_source(0, width=640, height=480, fourcc='MJPG')  # MJPG formatı zorunlu
 
 if not cap.isOpened():
     print("Kamera açılamadı")
@@ -0,0 +1,71 @@
+# src/dwell_scheduler.py
+import time
+from PyQt5.QtCore import QObject, QTimer
+
+# Tüm klavye için TEK dwell zamanlayıcısı.
+# Sadece bakılan (odaktaki) butonu izler; ilerleme tik sayarak değil monotonik zamandan
+# hesaplanır → olay döngüsü meşgulken de bekleme süresi doğru kalır. Sadece durumu
+# değişen buton yeniden çizilir.
+#
+# Butondan beklenenler: dwell_ms, repeat, hovered, set_progress(ms), click(),
+# isVisible(), isEnabled().
+
+
+class DwellScheduler(QObject):
+    """
+    focus(button) → bakılan buton (None: hiçbiri). Her bakış örneğinde çağrılabilir;
+    aynı buton için bir şey yapmaz.
+      • dwell_ms dolunca click()
+      • repeat=False: aynı bakış içinde bir kez basar
+      • repeat=True: ilk basıştan sonra her repeat_ms'de bir tekrar basar
+    """
+
+    def __init__(self, parent=None, tick_ms=30, repeat_ms=140):
+        super().__init__(parent)
+        self.repeat_s = repeat_ms / 1000.0
+        self.target = None
+        self._t0 = 0.0
+        self._fired = False
+        self._next_repeat = 0.0
+        self._timer = QTimer(self)
+        self._timer.setInterval(tick_ms)
+        self._timer.timeout.connect(self._tick)
+
+    def focus(self, button):
+        if button is self.target:
+            return
+        old = self.target
+        if old is not None:
+            old.hovered = False
+            old.set_progress(0)
+        self.target = button
+        if button is None:
+            self._timer.stop()
+            return
+        button.hovered = True
+        self._t0 = time.monotonic()
+        self._fired = False
+        self._timer.start()
+
+    def _tick(self):
+        b = self.target
+        if b is None or not b.isVisible() or not b.isEnabled():
+            self.focus(None)
+            return
+        now = time.monotonic()
+        if not self._fired:
+            elapsed = (now - self._t0) * 1000.0
+            if elapsed < b.dwell_ms:
+                b.set_progress(elapsed)
+                return
+            self._fired = True
+            b.set_progress(0)
+            if b.repeat:
+                self._next_repeat = now + self.repeat_s
+            else:
+                self._timer.stop()   # bakış değişene kadar yapılacak bir şey yok
+            b.click()
+        elif now >= self._next_repeat:
+            # geride kaldıysak tekrarları biriktirme
+            self._next_repeat = max(self._next_repeat, now - self.repeat_s) + self.repeat_s
+            b.click()
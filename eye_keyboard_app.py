@@ -5,9 +5,14 @@ from PyQt5.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QPushButton, QSizePolicy, QStackedWidget, QFrame
 )
-from PyQt5.QtCore import Qt, QTimer, QPoint, QRect
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QFont, QCursor, QPainter, QColor
 
+from gaze_hit_index import GazeHitIndex
+from dwell_scheduler import DwellScheduler
+from word_predictor import WordPredictor, LEXICON_PATH
+from ngram_model import NgramModel, NGRAM_PATH, tokenize
+
 
 # =======================
 # KLAVYE / VERİLER
@@ -26,7 +31,7 @@ NUMBER_GRID = [
     ['.', '0', ',']
 ]
 
-# Yazdıkça çıkacak örnek kelimeler (istersen büyütürüz)
+# Yazdıkça çıkacak örnek kelimeler — sözlük dosyası (LEXICON_PATH) yoksa bunlar kullanılır
 TURKISH_WORDS = {
     'M':  ['Merhaba', 'Müsait', 'Mutlu', 'Mümkün', 'Mesaj', 'Merak'],
     'ME': ['Merhaba', 'Mesaj', 'Merak', 'Meşgul', 'Merkez'],
@@ -84,7 +89,7 @@ PHRASE_CATEGORIES = [
 
 class GazeButton(QPushButton):
     """
-    - Dwell ile tıklama
+    - Dwell ile tıklama (zamanlama DwellScheduler'da; buton sadece durumunu çizer)
     - Harf/normal tuşlar: aynı hover içinde tekrar tekrar basmaz (eeee yapmaz)
     - repeat=True olan tuşlarda (Sil gibi) hover'da tekrarlar
     """
@@ -95,86 +100,24 @@ class GazeButton(QPushButton):
 
         self.hovered = False
         self.progress = 0
-        self.fired_while_hovered = False
 
         self._alive = True  # güvenlik
 
-        self.dwell_timer = QTimer(self)
-        self.dwell_timer.timeout.connect(self._tick)
-
-        self.repeat_timer = QTimer(self)
-        self.repeat_timer.timeout.connect(self._repeat_click)
-
         self.setMouseTracking(True)
 
     def cleanup(self):
-        """Widget silinmese bile dwell timerları kapat."""
+        """Widget silinmese bile dwell durumunu sıfırla."""
         self._alive = False
-        try:
-            self.dwell_timer.stop()
-            self.repeat_timer.stop()
-        except Exception:
-            pass
         self.hovered = False
-        self.progress = 0
-        self.fired_while_hovered = False
-        self.update()
+        self.set_progress(0)
 
-    def start_dwell(self):
-        if not self._alive:
-            return
-        if not self.isVisible() or not self.isEnabled():
-            return
-        if not self.hovered:
-            self.hovered = True
-            self.progress = 0
-            self.fired_while_hovered = False
-            self.dwell_timer.start(50)
+    def set_progress(self, ms):
+        """İlerleme çubuğu; sadece çizilen genişlik değişince yeniden çizilir."""
+        old = int((self.progress / self.dwell_ms) * self.width())
+        self.progress = ms
+        if int((ms / self.dwell_ms) * self.width()) != old:
             self.update()
 
-    def stop_dwell(self):
-        if not self._alive:
-            return
-        self.hovered = False
-        self.progress = 0
-        self.fired_while_hovered = False
-        self.dwell_timer.stop()
-        self.repeat_timer.stop()
-        self.update()
-
-    def _tick(self):
-        if not self._alive:
-            self.dwell_timer.stop()
-            return
-
-        if self.fired_while_hovered and not self.repeat:
-            self.dwell_timer.stop()
-            return
-
-        self.progress += 50
-
-        if self.progress >= self.dwell_ms:
-            self.dwell_timer.stop()
-            self.progress = 0
-            self.fired_while_hovered = True
-
-            # click tetikle
-            self.click()
-
-            if self.repeat:
-                self.repeat_timer.start(140)
-
-        self.update()
-
-    def _repeat_click(self):
-        if not self._alive:
-            self.repeat_timer.stop()
-            return
-        if self.hovered and self.repeat:
-            self.click()
-        else:
-            self.repeat_timer.stop()
-
     def paintEvent(self, e):
         if not self._alive:
             return
@@ -199,6 +142,12 @@ class EyeKeyboard(QMainWindow):
         self.current_view = "letters"
 
         self.all_buttons = []  # gaze kontrol listesi
+        self.predictor = WordPredictor.load(LEXICON_PATH, fallback=TURKISH_WORDS)
+        # sonraki kelime tahmini: hazır cümlelerle tohumlanır, yazdıkça öğrenir
+        self.ngram = NgramModel.load(NGRAM_PATH, seed=[p for _, ps in PHRASE_CATEGORIES for p in ps])
+        self._unsaved_words = 0
+        self.hit_index = GazeHitIndex(self)  # bakış → buton (sadece yerleşim değişince yeniden kurulur)
+        self.dwell = DwellScheduler(self)    # tek dwell zamanlayıcısı (sadece bakılan buton)
 
         # gaze koordinatları (istersen dış tracker burayı besler)
         self.gaze_x = 0
@@ -351,6 +300,7 @@ class EyeKeyboard(QMainWindow):
         b.setProperty("value", text)
         b.clicked.connect(self.on_button_clicked)
         self.all_buttons.append(b)
+        self.hit_index.add(b)
         return b
 
     def _make_key(self, text, action="CHAR", w=120, h=95, repeat=False, style=""):
@@ -534,7 +484,10 @@ class EyeKeyboard(QMainWindow):
             return
 
         if action == "SPACE":
+            committed = bool(self.text) and not self.text.endswith(" ")
             self.text += " "
+            if committed:
+                self._learn_words(1)
             self._refresh_text()
             return
 
@@ -554,6 +507,7 @@ class EyeKeyboard(QMainWindow):
             if self.text and not self.text.endswith(" "):
                 self.text += " "
             self.text += phrase + " "
+            self._learn_words(len(tokenize(phrase)))
             self._refresh_text()
             return
 
@@ -603,17 +557,8 @@ class EyeKeyboard(QMainWindow):
             self.gaze_x = pos.x()
             self.gaze_y = pos.y()
 
-        for b in self.all_buttons:
-            if not b.isVisible() or not b.isEnabled():
-                b.stop_dwell()
-                continue
-
-            g = b.mapToGlobal(QPoint(0, 0))
-            r = QRect(g, b.size())
-            if r.contains(self.gaze_x, self.gaze_y):
-                b.start_dwell()
-            else:
-                b.stop_dwell()
+        # Tek indeks araması; dwell sadece bakılan buton değişince başlar/durur
+        self.dwell.focus(self.hit_index.hit(self.gaze_x, self.gaze_y))
 
     # ---------- Text ----------
     def _refresh_text(self):
@@ -623,18 +568,20 @@ class EyeKeyboard(QMainWindow):
     # ---------- Suggestions (BUTONLAR SİLİNMİYOR; SADECE GÜNCELLENİYOR) ----------
     def update_suggestions(self):
         words = self.text.split()
-        current = words[-1].upper() if words and not self.text.endswith(" ") else ""
+        current = words[-1] if words and not self.text.endswith(" ") else ""
 
-        sug_list = []
         if current:
-            for L in range(len(current), 0, -1):
-                pref = current[:L]
-                if pref in TURKISH_WORDS:
-                    for w in TURKISH_WORDS[pref]:
-                        if w.upper().startswith(current) and w not in sug_list:
-                            sug_list.append(w)
+            # sıklığa göre en iyi 10 tamamlama (ikili arama + önbellek)
+            sug_list = self.predictor.complete(current, len(self.suggestion_buttons))
         else:
-            sug_list = ["Merhaba", "Günaydın", "Teşekkür", "Lütfen", "Evet", "Hayır", "Yardım", "Doktor", "Su", "Tamam"]
+            # kelime bitti → bağlama göre sonraki kelime tahmini, eksik kalırsa sabit liste
+            n = len(self.suggestion_buttons)
+            sug_list = self.ngram.predict(tokenize(self.text), n)
+            for w in ["Merhaba", "Günaydın", "Teşekkür", "Lütfen", "Evet", "Hayır", "Yardım", "Doktor", "Su", "Tamam"]:
+                if len(sug_list) >= n:
+                    break
+                if w not in sug_list:
+                    sug_list.append(w)
 
         # 10 sabit buton havuzunu güncelle
         for i, b in enumerate(self.suggestion_buttons):
@@ -669,8 +616,33 @@ class EyeKeyboard(QMainWindow):
             self.text = " ".join(parts) + " "
         else:
             self.text += word + " "
+        self._learn_words(1)
         self._refresh_text()
 
+    # ---------- Next-word model ----------
+    def _learn_words(self, new):
+        """Metnin son `new` kelimesini (önceki bağlamla) n-gram modeline ekler."""
+        words = tokenize(self.text)
+        if not words:
+            return
+        self.ngram.learn(words, new)
+        self._unsaved_words += new
+        if self._unsaved_words >= 20:
+            self.save_ngram()
+
+    def save_ngram(self):
+        if not self.ngram.dirty:
+            return
+        try:
+            self.ngram.save(NGRAM_PATH)
+            self._unsaved_words = 0
+        except OSError as e:
+            print(f"⚠️ N-gram modeli kaydedilemedi: {e}")
+
+    def closeEvent(self, event):
+        self.save_ngram()
+        super().closeEvent(event)
+
     # ---------- Internet ----------
     def open_google(self):
         q = self.text.strip()
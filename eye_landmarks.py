@@ -1,21 +1,15 @@
 # src/eye_landmarks.py
+import sys
 import cv2, mediapipe as mp, numpy as np
 
-# Göz ve iris noktaları
-LEFT_EYE  = [33,160,158,133,153,144]
-RIGHT_EYE = [263,387,385,362,380,373]
-LEFT_IRIS  = [468,469,470,471,472]
-RIGHT_IRIS = [473,474,475,476,477]
+from frame_source import open_source
+from landmarks import N_LANDMARKS, EYES_IRIS_IDX, landmarks_to_array
 
 mp_face = mp.solutions.face_mesh
+lm_buf = np.zeros((N_LANDMARKS, 3), dtype=np.float32)
 
-def get_pts(lmk, w, h, idxs):
-    return np.array([[lmk[i].x*w, lmk[i].y*h] for i in idxs], dtype=np.float32)
-
-# Kamera açılışı CAP_DSHOW ile
-cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
-cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+# Kamera (varsayılan) ya da komut satırından verilen kayıt: python eye_landmarks.py video.mp4
+cap = open_source(sys.argv[1] if len(sys.argv) > 1 else 0, width=640, height=480)
 
 with mp_face.FaceMesh(max_num_faces=1, refine_landmarks=True) as fm:
     while True:
@@ -29,9 +23,10 @@ with mp_face.FaceMesh(max_num_faces=1, refine_landmarks=True) as fm:
 
         if res.multi_face_landmarks:
             lm = res.multi_face_landmarks[0].landmark
-            for idxs in (LEFT_EYE, RIGHT_EYE, LEFT_IRIS, RIGHT_IRIS):
-                for (x,y) in get_pts(lm, w, h, idxs):
-                    cv2.circle(frame, (int(x),int(y)), 2, (0,255,0), -1)
+            # Göz + iris noktaları tek fancy-index ile
+            pts = landmarks_to_array(lm, w, h, lm_buf)
+            for (x,y) in pts[EYES_IRIS_IDX, :2]:
+                cv2.circle(frame, (int(x),int(y)), 2, (0,255,0), -1)
 
         cv2.putText(frame, "q: cikis", (10,30), cv2.FONT_HERSHEY_SIMPLEX, .7, (0,0,255), 2)
         cv2.imshow("Eye landmarks", frame)
@@ -2,34 +2,22 @@ import cv2, mediapipe as mp, numpy as np, time
 from pynput.mouse import Controller, Button
 import pyautogui
 
-# Göz noktaları
-LEFT_EYE  = [33,160,158,133,153,144]
-RIGHT_EYE = [263,387,385,362,380,373]
+from frame_source import open_source
+from landmarks import N_LANDMARKS, landmarks_to_array, eye_points, ear
 
 mp_face = mp.solutions.face_mesh
 mouse = Controller()
 
-# Eye Aspect Ratio (EAR) ile göz kırpma tespiti
-def ear(pts):
-    A = np.linalg.norm(pts[1]-pts[5])
-    B = np.linalg.norm(pts[2]-pts[4])
-    C = np.linalg.norm(pts[0]-pts[3]) + 1e-6
-    return (A+B)/(2.0*C)
-
-def get_pts(lmk, w, h, idxs):
-    return np.array([[lmk[i].x*w, lmk[i].y*h] for i in idxs], dtype=np.float32)
-
-def main(smoothing=0.15, ear_click_th=0.20, click_cooldown=0.25):
+def main(smoothing=0.15, ear_click_th=0.20, click_cooldown=0.25, source=0):
     pyautogui.FAILSAFE = True
     sw, sh = pyautogui.size()
 
-    # Kamerayı DSHOW ile aç
-    cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+    # Kamera (Windows: DSHOW, Linux: V4L2) veya kayıt
+    cap = open_source(source, width=640, height=480)
 
     prev = None
     last_click = 0
+    lm_buf = np.zeros((N_LANDMARKS, 3), dtype=np.float32)
 
     with mp_face.FaceMesh(max_num_faces=1, refine_landmarks=True) as fm:
         while True:
@@ -42,8 +30,8 @@ def main(smoothing=0.15, ear_click_th=0.20, click_cooldown=0.25):
 
             if res.multi_face_landmarks:
                 lm = res.multi_face_landmarks[0].landmark
-                L = get_pts(lm, w, h, LEFT_EYE)
-                R = get_pts(lm, w, h, RIGHT_EYE)
+                eyes = eye_points(landmarks_to_array(lm, w, h, lm_buf))
+                L, R = eyes
 
                 # İmleç konumu: sol göz ortalaması
                 gaze = L.mean(axis=0)
@@ -56,7 +44,7 @@ def main(smoothing=0.15, ear_click_th=0.20, click_cooldown=0.25):
                 mouse.position = (mx, my)
 
                 # Göz kırpma → sol tık
-                ear_val = (ear(L) + ear(R)) / 2.0
+                ear_val = float(ear(eyes).mean())  # Eye Aspect Ratio (EAR) ile göz kırpma tespiti
                 now = time.time()
                 if ear_val < ear_click_th and (now - last_click) > click_cooldown:
                     mouse.click(Button.left, 1)
@@ -1,212 +1,501 @@
 # src/eye_mouse_calibrated.py
-import cv2, mediapipe as mp, numpy as np, time, joblib
-from pynput.mouse import Controller, Button
-import pyautogui
-
-# --- Göz landmark indeksleri ---
-LEFT_EYE  = [33,160,158,133,153,144]
-RIGHT_EYE = [263,387,385,362,380,373]
+import cv2, mediapipe as mp, numpy as np, time, os, threading
+
+from camera_capture import CameraCapture
+from frame_source import open_source
+from landmarks import N_LANDMARKS, FEATURES, POSE_FEATURES, POSE_SLICE, landmarks_to_array, eye_points, iris_points, ear, gaze_features
+from head_pose import HeadPose
+from calibration_mapper import CalibrationMapper, MODEL_NPZ_PATH
+from online_recalibration import OnlineRecalibrator
+from gaze_filters import FILTERS, make_filter
+from roi_tracker import RoiTracker
+from metrics import PipelineMetrics
+from mouse_actuator import MouseActuator, PynputSink
+from tracker_params import TrackerParams, DEFAULT_PARAMS
 
 mp_face = mp.solutions.face_mesh
-mouse = Controller()
-stop_flag = False
 
 # ----------------- Yardımcılar -----------------
-def ear(pts: np.ndarray) -> float:
-    """Eye Aspect Ratio (EAR)"""
-    A = np.linalg.norm(pts[1]-pts[5])
-    B = np.linalg.norm(pts[2]-pts[4])
-    C = np.linalg.norm(pts[0]-pts[3]) + 1e-6
-    return (A + B) / (2.0 * C)
-
-def get_pts(lmk, w, h, idxs):
-    return np.array([[lmk[i].x*w, lmk[i].y*h] for i in idxs], dtype=np.float32)
+def load_mapper(npz_path=MODEL_NPZ_PATH, pkl_path="../data/models/calibration_model.pkl"):
+    """
+    Katsayı dosyasını (.npz) yükler. Sadece eski .pkl varsa bir kez dönüştürür;
+    bu durumda joblib/sklearn yalnızca burada gerekir.
+    """
+    if not os.path.exists(npz_path) and os.path.exists(pkl_path):
+        import joblib
+        CalibrationMapper.from_sklearn(joblib.load(pkl_path)).save(npz_path)
+        print(f"ℹ️ {pkl_path} → {npz_path} dönüştürüldü.")
+    return CalibrationMapper.load(npz_path)
+
+def screen_size():
+    import pyautogui
+    pyautogui.FAILSAFE = True
+    return pyautogui.size()
 
-def stop():
-    global stop_flag
-    stop_flag = True
-
-# ----------------- Ana Döngü -----------------
-def main(
-    # hareket/klik
-    smoothing=0.22,             # temel yumuşatma (yakında kullanılır)
-    ear_click_th=0.20,
-    click_cooldown=0.30,        # tıklamalar arası bekleme (s)
-    enable_right_click=True,    # sağ göz 2x → sağ tık
-    enable_double_click=False,  # iki göz 2x → çift tık (opsiyonel)
-    dbl_blink_window=0.60,      # iki kırpma arası max süre (s)
-    # stabilizasyon
-    hold_on_blink=True,         # göz kapalıyken imleci tut
-    hold_extra_ms=0.12,         # açıldıktan sonra şu kadar s daha tut
-    deadzone_px=4,              # küçük titreşimleri yok say
-    max_step_px=35,             # bir karede max adım
-    # hız/yaklaşma
-    sens_gain=1.6,              # 👈 Hız kazancı (dx,dy çarpanı)
-    far_dist=120,               # 👈 Uzak hedef eşiği (px)
-    alpha_far=0.35,              # 👈 Uzakta iken daha yüksek alpha (daha hızlı)
-    frame_callback=None,        # 👈 GUI'ye frame göndermek için callback
-    show_preview=True           # 👈 cv2.imshow açılsın mı?
-):
+# ----------------- Motor -----------------
+class EyeMouseEngine:
     """
     Kalibrasyonlu göz→mouse kontrolü:
       • Aynı gözle 2 hızlı kırpma → tıklama (sol/sağ)
-      • Hold-on-blink, deadzone, max-step
-      • Hız kazancı (sens_gain) + uzak/ yakın hedefe göre adaptif smoothing
+      • Hold-on-blink
+      • Seçilebilir yumuşatma (gaze_filters): eski zincir (sens_gain, deadzone, max-step,
+        uzak/yakın adaptif smoothing), One Euro veya Kalman
+
+    Kamera, kalibrasyon modeli ve FaceMesh open() ile bir kez açılır ve oturumlar
+    arasında sıcak tutulur; start()/stop() sadece takip thread'ini başlatır/durdurur.
+      start(), stop(), pause(), resume() → anında
+      update(**ayarlar)                  → çalışırken, bir sonraki karede geçerli
+      confirm_target(x, y)               → kullanıcının baktığı kesin nokta (ör. seçilen tuşun
+                                           merkezi); çevrimiçi düzeltme için örnek
+      reset_recalibration()              → onaylanan hedeflerle öğrenilen düzeltmeyi atar
+      close()                            → kamerayı ve FaceMesh'i bırakır
     """
-    global stop_flag
-    stop_flag = False
-
-    pyautogui.FAILSAFE = True
-    sw, sh = pyautogui.size()
-
-    # Kalibrasyon modeli: (gaze_x, gaze_y) -> (screen_x, screen_y)
-    model = joblib.load("../data/models/calibration_model.pkl")
-    print("✅ Kalibrasyon modeli yüklendi.")
-
-    cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-
-    prev = None               # önceki imleç konumu
-    last_click = 0.0          # global tıklama cooldown
-
-    # --- Double-blink durumları ---
-    left_closed  = False
-    right_closed = False
-    left_blink_count  = 0
-    right_blink_count = 0
-    left_last_blink_time  = 0.0
-    right_last_blink_time = 0.0
-
-    with mp_face.FaceMesh(max_num_faces=1, refine_landmarks=True) as fm:
-        while True:
-            if stop_flag:
-                break
 
-            ok, frame = cap.read()
+    def __init__(
+        self,
+        # kaynak
+        source=0,                   # kamera indeksi / video / resim klasörü / "synthetic"
+        realtime=True,              # kayıtlar: doğal hızda mı, olabildiğince hızlı mı?
+        use_roi=True,               # FaceMesh'i sadece yüz bölgesinde çalıştır
+        # çıkış / model
+        mouse_sink=None,            # move(x,y)/click(button) sunan hedef; None → gerçek imleç
+        threaded_output=True,       # imleç çıkışı ayrı thread'de (hareketler birleştirilir)
+        move_rate_hz=125,           # işletim sistemine saniyede en fazla bu kadar hareket
+        screen=None,                # (sw, sh); None → pyautogui.size()
+        model_path=MODEL_NPZ_PATH,
+        # ölçüm
+        metrics_interval=1.0,       # özet kaç saniyede bir üretilsin
+        metrics_path=None,          # verilirse özetler JSON Lines olarak eklenir
+        **params                    # TrackerParams alanları
+    ):
+        self.params = DEFAULT_PARAMS._replace(**params)
+        self.params_version = 0         # her update() ile artar
+        self._params_lock = threading.Lock()   # sadece yazanlar arasında (GUI thread'leri)
+        self.source = source
+        self.realtime = realtime
+        self.use_roi = use_roi
+        self.mouse_sink = mouse_sink
+        self.threaded_output = threaded_output
+        self.move_rate_hz = move_rate_hz
+        self.screen = screen
+        self.model_path = model_path
+        self.metrics_interval = metrics_interval
+        self.metrics_path = metrics_path
+
+        # oturum callback'leri
+        self.frame_callback = None      # 👈 GUI'ye frame göndermek için callback
+        self.preview = None             # 👈 PreviewBuffer: gösterim boyutunda, kopyasız GUI önizlemesi
+        self.gaze = None                # 👈 GazeChannel: filtrelenmiş bakış örnekleri (klavye için)
+        self.metrics_callback = None    # 👈 aşama süreleri / FPS özetini almak için callback
+        self.stopped_callback = None    # oturum bittiğinde (thread içinden) çağrılır
+        self.show_preview = False       # 👈 cv2.imshow açılsın mı?
+
+        self._opened = False
+        self._open_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._resume = threading.Event()
+        self._resume.set()
+        self._thread = None
+        self._active = False
+        self._recal_reset = False
+        self._confirm = None            # confirm_target() ile bekleyen (x, y); tek yer, sonuncusu geçerli
+
+    # ----------------- Kaynaklar -----------------
+    def open(self):
+        """Kamera, model ve FaceMesh'i açar (zaten açıksa bir şey yapmaz)."""
+        with self._open_lock:
+            if self._opened:
+                return
+            self.sw, self.sh = self.screen if self.screen is not None else screen_size()
+            sink = self.mouse_sink if self.mouse_sink is not None else PynputSink()
+            self.mouse = MouseActuator(sink, self.move_rate_hz) if self.threaded_output else sink
+
+            # Kalibrasyon modeli: göz/iris özellikleri -> (screen_x, screen_y)
+            self.mapper = load_mapper(self.model_path)
+            # Modelin girişleri FEATURES içinden adla seçilir (eye_*, left_*/right_*, iris_*, baş pozu)
+            self._feat_idx = np.array([FEATURES.index(c) for c in self.mapper.inputs], dtype=np.intp)
+            self._feat = np.zeros(len(FEATURES))
+            self._x = np.zeros(len(self._feat_idx))
+            self._uses_pose = any(c in POSE_FEATURES for c in self.mapper.inputs)
+            # Onaylanan hedeflerle çevrimiçi düzeltme; model gibi oturumlar arasında korunur
+            self.recal = OnlineRecalibrator(self.mapper)
+            print(f"✅ Kalibrasyon modeli yüklendi ({', '.join(self.mapper.inputs)}).")
+
+            # Gerçek zamanlı kaynaklar ayrı thread'de okunur; döngü her zaman en yeni kareyi alır.
+            # Hızlı oynatmada (realtime=False) her kare sırayla işlenir.
+            src = open_source(self.source, realtime=self.realtime)
+            self.cap = CameraCapture(src, 640, 480) if src.realtime else src
+            # Kayıtlar hızlı oynatılırken kırpma zamanlamaları medya zamanına göre işler
+            self.clock = time.time if src.realtime else (lambda: src.frame_time)
+
+            self.fm = mp_face.FaceMesh(max_num_faces=1, refine_landmarks=True)
+            self._lm_buf = np.zeros((N_LANDMARKS, 3), dtype=np.float32)  # kare başına landmark tamponu
+            self.metrics = PipelineMetrics()
+            self._opened = True
+
+    def close(self):
+        """Oturumu durdurur ve tüm kaynakları bırakır."""
+        self.stop()
+        self.wait(2.0)
+        self._release()
+
+    def _release(self):
+        with self._open_lock:
+            if not self._opened:
+                return
+            self.cap.release()
+            self.fm.close()
+            if isinstance(self.mouse, MouseActuator):
+                self.mouse.close()
+            if isinstance(self.cap, CameraCapture):
+                print(f"ℹ️ Kareler: {self.cap.frames_captured} yakalandı, {self.cap.frames_dropped} atlandı.")
+            if self.recal.updates or self.recal.rejected:
+                print(f"ℹ️ Çevrimiçi kalibrasyon: {self.recal.updates} hedef kullanıldı, {self.recal.rejected} reddedildi.")
+            self._opened = False
+
+    # ----------------- Kontrol -----------------
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def active(self):
+        """start() ile başlatılan oturum henüz bitmedi mi? (stopped_callback'ten önce False olur)"""
+        return self._active
+
+    @property
+    def paused(self):
+        return not self._resume.is_set()
+
+    def update(self, **params):
+        """Ayarları çalışırken değiştirir; döngü bir sonraki karede yeni değerleri görür."""
+        if params.get("filter", "legacy") not in FILTERS:
+            raise ValueError(f"Bilinmeyen filtre: {params['filter']} (seçenekler: {', '.join(FILTERS)})")
+        with self._params_lock:
+            self.params = self.params._replace(**params)
+            self.params_version += 1   # görüntü atandıktan SONRA → döngü eski değeri almaz
+
+    def start(self, frame_callback=None, metrics_callback=None, stopped_callback=None,
+              show_preview=False, preview=None, gaze=None):
+        """
+        Takibi arka plan thread'inde başlatır. İlk seferde kaynaklar da (thread içinde) açılır.
+        Önceki oturum hâlâ kapanıyorsa durdurulup bitmesi beklenir (onun stopped_callback'i
+        bu çağrı dönmeden çalışır); yeni oturum her zaman başlar.
+        """
+        if self.running:
+            self.stop()
+            self.wait()
+        self.frame_callback = frame_callback
+        self.preview = preview
+        self.gaze = gaze
+        self.metrics_callback = metrics_callback
+        self.stopped_callback = stopped_callback
+        self.show_preview = show_preview
+        self._stop.clear()
+        self._resume.set()
+        self._confirm = None
+        self._active = True
+        self._thread = threading.Thread(target=self._session, name="EyeMouseEngine", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._resume.set()   # duraklatılmışsa da çıkabilsin
+
+    def pause(self):
+        """İmleç/tık durur; kamera ve model açık kalır."""
+        self._resume.clear()
+
+    def resume(self):
+        self._resume.set()
+
+    def wait(self, timeout=None):
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def confirm_target(self, x, y):
+        """
+        Kullanıcının şu an baktığı kesin ekran noktası (global piksel), ör. dwell ile seçilen
+        tuşun merkezi. Bir sonraki karede son açık-göz bakış özelliğiyle eşlenip modele
+        eklenir (online_recal). İmlecin kendi konumu verilmemeli: model kendi çıktısını öğrenir.
+        """
+        self._confirm = (x, y)
+
+    def reset_recalibration(self):
+        """Onaylanan hedeflerle yapılan düzeltmeleri atar, dosyadaki modele döner (bir sonraki karede)."""
+        self._recal_reset = True
+
+    def _recalibrate(self, p, fix, x, y):
+        """Göz kapanmadan önceki bakış özelliği ↔ arayüzün bildirdiği hedef."""
+        recal = self.recal
+        recal.forget = p.recal_forget
+        recal.max_px = p.recal_max_px
+        recal.update(fix, (x, y), p.recal_weight)
+
+    def _session(self):
+        try:
+            self.run()
+        except Exception as e:
+            print(f"Hata: {e}")
+        finally:
+            self._active = False
+            if self.stopped_callback is not None:
+                self.stopped_callback()
+
+    # ----------------- Ana Döngü -----------------
+    def run(self):
+        """Takip döngüsü (çağıran thread'de); stop() veya kaynak bitince döner."""
+        self.open()
+        cap, fm, metrics = self.cap, self.fm, self.metrics
+
+        filt = make_filter(self.params)   # imleç yumuşatma (TrackerParams.filter)
+        started = False           # ilk yüz karesinde filtre ham hedefe kurulur
+        last_click = 0.0          # global tıklama cooldown
+
+        # --- Double-blink durumları ---
+        left_closed  = False
+        right_closed = False
+        left_blink_count  = 0
+        right_blink_count = 0
+        left_last_blink_time  = 0.0
+        right_last_blink_time = 0.0
+
+        # use_roi=False iken kutu hiç güncellenmez → her kare tam kare arama
+        roi = RoiTracker()
+        head = None               # baş pozu (model kullanıyorsa); kare boyutu ilk yüzde belli olur
+        pose_ok = False           # yüz bulunduğundan beri en az bir poz çözüldü mü?
+        frame_callback, metrics_callback = self.frame_callback, self.metrics_callback
+        preview, show_preview = self.preview, self.show_preview
+        gaze_out = self.gaze
+
+        # Hedef onayı için bakış: gözler açıkken model girişlerinin EMA'sı; kırpma sırasında donar
+        fix = np.zeros(len(self._feat_idx))
+        fix_ok = False
+
+        next_report = time.perf_counter() + self.metrics_interval
+        source_ended = False
+        p_version = self.params_version
+        p = self.params
+
+        while not self._stop.is_set():
+            if not self._resume.is_set():
+                self._resume.wait()
+                continue
+            if self.params_version != p_version:   # ayar değişti → bu kareden itibaren geçerli
+                p_version = self.params_version
+                p = self.params
+                if p.filter != filt.name:
+                    # strateji değişti → yenisi son imleç konumundan devam eder
+                    x, y = filt.x, filt.y
+                    filt = make_filter(p)
+                    filt.reset(x, y, self.clock())
+                else:
+                    filt.configure(p)
+            if self._recal_reset:
+                self._recal_reset = False
+                self.recal.reset()
+            if self._confirm is not None:
+                target, self._confirm = self._confirm, None
+                if p.online_recal and fix_ok:
+                    self._recalibrate(p, fix, *target)
+
+            metrics.begin_frame()
+            ok, raw = cap.read()
             if not ok:
+                source_ended = True
                 break
-            frame = cv2.flip(frame, 1)
-            h, w = frame.shape[:2]
-            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            metrics.mark("capture")
+
+            # Flip + renk dönüşümü + FaceMesh sadece yüz kırpması üzerinde
+            rgb = roi.prepare(raw)
+            metrics.mark("convert")
             res = fm.process(rgb)
+            metrics.mark("facemesh")
 
+            eyes = None
+            pts = None
             if res.multi_face_landmarks:
                 lm = res.multi_face_landmarks[0].landmark
-                L = get_pts(lm, w, h, LEFT_EYE)
-                R = get_pts(lm, w, h, RIGHT_EYE)
-
-                now = time.time()
-                L_ear = ear(L)
-                R_ear = ear(R)
+                pts = roi.to_frame(landmarks_to_array(lm, roi.crop_w, roi.crop_h, self._lm_buf))
+                if self.use_roi:
+                    roi.update(pts)
+                # Model baş pozu kullanıyorsa poz sadece burada çözülür; ilk başarılı çözüme kadar
+                # (poz alanları henüz anlamsız) tahmin ve imleç hareketi yapılmaz
+                if self._uses_pose:
+                    if head is None:
+                        head = HeadPose(roi.frame_w, roi.frame_h)
+                    if head.estimate(pts, self._feat[POSE_SLICE]):   # başarısızsa önceki poz kalır
+                        pose_ok = True
+
+            if pts is not None and (pose_ok or not self._uses_pose):
+                eyes = eye_points(pts)          # (2,6,2): sol, sağ
+                iris = iris_points(pts)         # (2,5,2)
+
+                now = self.clock()
+                L_ear, R_ear = ear(eyes)
+                metrics.mark("ear")
 
                 # --- Hedef imleç konumu (kalibrasyon modeli) ---
-                gaze = np.vstack((L, R)).mean(axis=0)
-                pred = model.predict([[gaze[0], gaze[1]]])[0]
-                tx = int(np.clip(pred[0], 0, sw - 1))
-                ty = int(np.clip(pred[1], 0, sh - 1))
-
-                # --- Stabil hareket (Hold + Deadzone + Max-step + Adaptif smoothing) ---
-                any_closed = (L_ear < ear_click_th) or (R_ear < ear_click_th)
+                gaze_features(eyes, iris, self._feat)
+                np.take(self._feat, self._feat_idx, out=self._x)
+                pred = self.mapper.predict(self._x)
+                tx = int(np.clip(pred[0], 0, self.sw - 1))
+                ty = int(np.clip(pred[1], 0, self.sh - 1))
+                metrics.mark("predict")
+
+                # --- Stabil hareket (Hold + seçili yumuşatma stratejisi) ---
+                any_closed = (L_ear < p.ear_click_th) or (R_ear < p.ear_click_th)
                 just_reopened = (
-                    (now - left_last_blink_time)  < hold_extra_ms or
-                    (now - right_last_blink_time) < hold_extra_ms
+                    (now - left_last_blink_time)  < p.hold_extra_ms or
+                    (now - right_last_blink_time) < p.hold_extra_ms
                 )
 
-                if prev is None:
-                    prev = (tx, ty)
-
-                if hold_on_blink and (any_closed or just_reopened):
-                    mx, my = prev
-                else:
-                    # fark + hız kazancı
-                    dx = (tx - prev[0]) * sens_gain
-                    dy = (ty - prev[1]) * sens_gain
-
-                    # deadzone
-                    if abs(dx) < deadzone_px: dx = 0
-                    if abs(dy) < deadzone_px: dy = 0
-
-                    # max step
-                    if dx > 0:  dx = min(dx, max_step_px)
-                    else:       dx = max(dx, -max_step_px)
-                    if dy > 0:  dy = min(dy, max_step_px)
-                    else:       dy = max(dy, -max_step_px)
-
-                    # uzak/ yakın adaptif smoothing
-                    dist = ((tx - prev[0])**2 + (ty - prev[1])**2) ** 0.5
-                    alpha = alpha_far if dist > far_dist else smoothing
+                if not (any_closed or just_reopened):
+                    if fix_ok:
+                        fix += 0.3 * (self._x - fix)
+                    else:
+                        fix[:] = self._x
+                        fix_ok = True
 
-                    mx = prev[0] + dx
-                    my = prev[1] + dy
-                    mx = int(prev[0] * (1 - alpha) + mx * alpha)
-                    my = int(prev[1] * (1 - alpha) + my * alpha)
+                if not started:
+                    filt.reset(tx, ty, now)
+                    started = True
 
-                prev = (mx, my)
-                mouse.position = (mx, my)
+                if p.hold_on_blink and (any_closed or just_reopened):
+                    pass                        # göz kapalıyken imleci tut
+                else:
+                    filt.update(tx, ty, now)
+                mx, my = filt.x, filt.y
+                metrics.mark("smooth")
+                if gaze_out is not None:
+                    gaze_out.publish(mx, my, now)
+                if p.os_cursor:
+                    self.mouse.move(mx, my)
 
                 # --- Double-blink tıklama mantığı ---
                 # Sol göz: kapandı -> açıldı
-                if not left_closed and L_ear < ear_click_th:
+                if not left_closed and L_ear < p.ear_click_th:
                     left_closed = True
-                if left_closed and L_ear >= ear_click_th:
+                if left_closed and L_ear >= p.ear_click_th:
                     left_closed = False
-                    if now - left_last_blink_time <= dbl_blink_window:
+                    if now - left_last_blink_time <= p.dbl_blink_window:
                         left_blink_count += 1
                     else:
                         left_blink_count = 1
                     left_last_blink_time = now
 
-                    if left_blink_count >= 2 and (now - last_click) > click_cooldown:
-                        mouse.click(Button.left, 1)
+                    if p.os_cursor and left_blink_count >= 2 and (now - last_click) > p.click_cooldown:
+                        self.mouse.click("left")
                         last_click = now
                         left_blink_count = 0
 
                 # Sağ göz: kapandı -> açıldı
-                if not right_closed and R_ear < ear_click_th:
+                if not right_closed and R_ear < p.ear_click_th:
                     right_closed = True
-                if right_closed and R_ear >= ear_click_th:
+                if right_closed and R_ear >= p.ear_click_th:
                     right_closed = False
-                    if now - right_last_blink_time <= dbl_blink_window:
+                    if now - right_last_blink_time <= p.dbl_blink_window:
                         right_blink_count += 1
                     else:
                         right_blink_count = 1
                     right_last_blink_time = now
 
-                    if enable_right_click and right_blink_count >= 2 and (now - last_click) > click_cooldown:
-                        mouse.click(Button.right, 1)
+                    if p.os_cursor and p.enable_right_click and right_blink_count >= 2 and (now - last_click) > p.click_cooldown:
+                        self.mouse.click("right")
                         last_click = now
                         right_blink_count = 0
 
                 # (Opsiyonel) iki göz için double-click
-                if enable_double_click:
+                if p.enable_double_click:
                     # İstersen burada iki göz için benzer pencere mantığıyla çift tık ekleyebilirsin.
                     pass
+                metrics.mark("mouse")
+            elif pts is None:
+                # Takip kaybı → sonraki karede tam kare arama
+                roi.reset()
+                if head is not None:
+                    head.reset()
+                pose_ok = False           # yüz dönünce yine ilk başarılı pozu bekle
+                fix_ok = False            # eski bakış yeni bir hedef onayıyla eşlenmesin
+
+            quit_key = False
+            # GUI önceki önizleme karesini henüz göstermediyse bu kare çizilmez
+            publish = preview is not None and preview.wants_frame()
+            if publish or frame_callback is not None or show_preview:
+                # Önizleme için aynalanmış tam kare (sadece gösterilecekse)
+                frame = cv2.flip(raw, 1)
 
                 # --- Görsel geri bildirim ---
-                for (x, y) in np.vstack((L, R)):
-                    cv2.circle(frame, (int(x), int(y)), 1, (0, 255, 0), -1)
-                cv2.putText(
-                    frame,
-                    f"L:{L_ear:.2f} R:{R_ear:.2f} | L2x:{left_blink_count} R2x:{right_blink_count}  q:cikis",
-                    (10, 30),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.65, (0, 0, 255), 2
-                )
+                if eyes is not None:
+                    for (x, y) in eyes.reshape(-1, 2):
+                        cv2.circle(frame, (int(x), int(y)), 1, (0, 255, 0), -1)
+                    for (x, y) in iris[:, 0]:
+                        cv2.circle(frame, (int(x), int(y)), 2, (255, 200, 0), -1)
+                    cv2.putText(
+                        frame,
+                        f"L:{L_ear:.2f} R:{R_ear:.2f} | L2x:{left_blink_count} R2x:{right_blink_count}  q:cikis",
+                        (10, 30),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.65, (0, 0, 255), 2
+                    )
+
+                # Önizleme: işçi thread'inde gösterim boyutuna küçültülür, GUI'ye sadece bildirim gider
+                if publish:
+                    preview.publish(frame)
+
+                # Callback varsa frame gönder
+                if frame_callback is not None:
+                    # Çizimler 'frame' (BGR) üzerinde yapıldı; GUI RGB ister.
+                    final_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                    frame_callback(final_rgb)
+
+                if show_preview:
+                    cv2.imshow("Eye mouse (calibrated)", frame)
+                    cv2.setWindowProperty("Eye mouse (calibrated)", cv2.WND_PROP_TOPMOST, 1)
+                    quit_key = cv2.waitKey(1) & 0xFF == ord('q')
+                metrics.mark("preview")
+
+            # --- Ölçüm özeti ---
+            metrics.end_frame(getattr(cap, "frames_dropped", 0))
+            if (metrics_callback is not None or self.metrics_path) and time.perf_counter() >= next_report:
+                next_report += self.metrics_interval
+                snap = metrics.snapshot()
+                if metrics_callback is not None:
+                    metrics_callback(snap)
+                if self.metrics_path:
+                    metrics.dump(self.metrics_path, snap)
+
+            if quit_key:
+                break
+
+        if show_preview:
+            cv2.destroyAllWindows()
+        if metrics_callback is not None:
+            metrics_callback(metrics.snapshot())   # son özet
+        if source_ended:
+            # Video bitti / kamera kayboldu → kaynaklar bırakılır, sonraki start() yeniden açar
+            self._release()
 
-            # Callback varsa frame gönder
-            if frame_callback is not None:
-                # Frame'i GUI thread'inde işlenmesi için kopyalayabiliriz veya direk gönderebiliriz.
-                # GUI genellikle RGB ister, biz zaten rgb değişkenine sahibiz.
-                # Ancak çizimler 'frame' (BGR) üzerinde yapıldı.
-                # Bu yüzden çizim yapılmış frame'i RGB'ye çevirip göndermek mantıklı.
-                final_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                frame_callback(final_rgb)
-
-            if show_preview:
-                cv2.imshow("Eye mouse (calibrated)", frame)
-                cv2.setWindowProperty("Eye mouse (calibrated)", cv2.WND_PROP_TOPMOST, 1)
-                if cv2.waitKey(1) & 0xFF == ord('q'):
-                    break
-
-    cap.release()
-    cv2.destroyAllWindows()
+# ----------------- Eski arayüz -----------------
+_active = None
+
+def stop():
+    """main() ile çalışan motoru durdurur."""
+    if _active is not None:
+        _active.stop()
+
+def main(frame_callback=None, show_preview=True, metrics_callback=None, **kwargs):
+    """
+    Tek seferlik kullanım: motoru açar, bu thread'de çalıştırır ve kapatır.
+    kwargs → EyeMouseEngine (kaynak/çıkış seçenekleri + TrackerParams alanları).
+    """
+    global _active
+    engine = EyeMouseEngine(**kwargs)
+    engine.frame_callback = frame_callback
+    engine.metrics_callback = metrics_callback
+    engine.show_preview = show_preview
+    _active = engine
+    try:
+        engine.run()
+    finally:
+        engine.close()
+        _active = None
@@ -0,0 +1,164 @@
+# src/filter_eval.py
+"""
+Yumuşatma stratejilerinin çevrimdışı karşılaştırması (gecikme / titreşim).
+
+Kayıtlı bir bakış izi her stratejiden (gaze_filters) geçirilir:
+  • lag_ms    → hedef değişiminden sonra çıkışın adımın %90'ını kat etme süresi
+                (ortalama; segment içinde erişemezse segment süresi sayılır)
+  • jitter_px → çıkış hedefe vardıktan sonra kendi ortalaması etrafındaki RMS sapması
+                (adımsız segmentlerde ikinci yarı; hedefe hiç varılmayan segment sayılmaz)
+  • us        → kare başına ortalama filtre süresi
+
+İz kaynakları:
+  • kalibrasyon oturumu (.cal / eski .csv) + model → her hedef bir fiksasyon segmenti;
+    hedefler arası bekleme çıkarılır (hedef değişimi = anlık sakkad, ortanca kare aralığı)
+  • CSV (t, x, y, target sütunları) → ham bakış izi
+
+Kullanım:
+  python filter_eval.py                                   # varsayılan kalibrasyon oturumu + model
+  python filter_eval.py --trace iz.csv
+  python filter_eval.py --set euro_beta=0.02 --set kalman_lead=0.03
+  python filter_eval.py --max-jitter 6                    # bu titreşim sınırında en düşük gecikme (varsayılan 5 px)
+"""
+import argparse, time
+import numpy as np
+
+from calibration_mapper import CalibrationMapper, MODEL_NPZ_PATH
+from calibration_store import load_samples, CALIB_PATH
+from tracker_params import DEFAULT_PARAMS
+from gaze_filters import FILTERS
+
+MIN_STEP_PX = 50     # daha küçük hedef değişimleri gecikme ölçümüne girmez
+REACH = 0.9          # adımın bu oranı kat edilince hedefe "varıldı"
+MAX_JITTER_PX = 5.0  # öneri için varsayılan titreşim sınırı ("none" hiç önerilmez: gecikmesi tanım gereği 0)
+
+
+# ----------------- İz -----------------
+def _compact_time(t, target):
+    """Hedefler arası boşlukları ortanca kare aralığına indirir."""
+    d = np.diff(t)
+    jump = np.diff(target) != 0
+    inner = d[~jump & (d > 0)]
+    d[jump | (d <= 0)] = np.median(inner) if len(inner) else 1.0 / 30
+    return np.concatenate([[0.0], np.cumsum(d)])
+
+
+def trace_from_calibration(path=CALIB_PATH, model_path=MODEL_NPZ_PATH):
+    """Kalibrasyon örnekleri → (t, x, y, target) ham model çıktısı."""
+    loaded = load_samples(path)
+    if loaded is None:
+        raise FileNotFoundError(path)
+    _, data = loaded
+    mapper = CalibrationMapper.load(model_path)
+    X = np.column_stack([data[c] for c in mapper.inputs])
+    xy = mapper.predict_many(X)
+    target = data["target"].astype(np.int64)
+    if "t" in data:
+        t = _compact_time(data["t"].astype(np.float64), target)
+    else:
+        t = np.arange(len(target)) / 30.0
+    return t, xy[:, 0], xy[:, 1], target
+
+
+def trace_from_csv(path):
+    with open(path, encoding="utf-8") as f:
+        columns = f.readline().strip().split(",")
+    table = np.loadtxt(path, delimiter=",", skiprows=1, ndmin=2)
+    col = {c: table[:, i] for i, c in enumerate(columns)}
+    return col["t"], col["x"], col["y"], col["target"].astype(np.int64)
+
+
+# ----------------- Değerlendirme -----------------
+def run_filter(filt, t, x, y):
+    """İzi filtreden geçirir → (çıkış (n,2), kare başına µs)."""
+    filt.reset(x[0], y[0], t[0])
+    tl, xl, yl = t.tolist(), x.tolist(), y.tolist()
+    ox, oy = [0] * len(tl), [0] * len(tl)
+    t0 = time.perf_counter()
+    for i in range(len(tl)):
+        filt.update(xl[i], yl[i], tl[i])
+        ox[i], oy[i] = filt.x, filt.y
+    us = (time.perf_counter() - t0) / len(tl) * 1e6
+    return np.column_stack([ox, oy]).astype(np.float64), us
+
+
+def score(t, x, y, target, out):
+    """→ {"lag_ms", "jitter_px"}; segmentler = ardışık aynı hedef numaraları."""
+    starts = np.flatnonzero(np.r_[True, np.diff(target) != 0])
+    ends = np.r_[starts[1:], len(target)]
+    raw = np.column_stack([x, y])
+    level = [np.median(raw[a:b], axis=0) for a, b in zip(starts, ends)]
+
+    lags, jit = [], []
+    for i, (a, b) in enumerate(zip(starts, ends)):
+        # titreşim sadece yerleşmiş çıkışta: geçiş (sakkad kuyruğu) RMS'e girerse
+        # yavaş filtreler titrek görünür
+        settled = (a + b) // 2
+        if i > 0:
+            step = np.hypot(*(level[i] - level[i - 1]))
+            if step >= MIN_STEP_PX:
+                dist = np.hypot(*(out[a:b] - level[i]).T)
+                hit = np.flatnonzero(dist <= (1 - REACH) * step)
+                lags.append((t[a + hit[0]] if len(hit) else t[b - 1]) - t[a])
+                settled = a + hit[0] if len(hit) else b
+        rest = out[settled:b]
+        if len(rest) >= 2:
+            jit.append(np.sqrt(((rest - rest.mean(axis=0)) ** 2).sum(axis=1).mean()))
+    return {
+        "lag_ms": float(np.mean(lags) * 1000) if lags else float("nan"),
+        "jitter_px": float(np.mean(jit)) if jit else float("nan"),
+    }
+
+
+def evaluate(trace, params=DEFAULT_PARAMS, names=None):
+    """Her strateji → {"lag_ms", "jitter_px", "us"}."""
+    t, x, y, target = trace
+    results = {}
+    for name in names or FILTERS:
+        out, us = run_filter(FILTERS[name](params), t, x, y)
+        results[name] = dict(score(t, x, y, target, out), us=us)
+    return results
+
+
+def _parse_set(items):
+    kw = {}
+    for item in items or []:
+        key, _, val = item.partition("=")
+        if key not in DEFAULT_PARAMS._fields:
+            raise SystemExit(f"Bilinmeyen ayar: {key}")
+        default = getattr(DEFAULT_PARAMS, key)
+        if isinstance(default, bool):
+            kw[key] = val.lower() in ("1", "true", "evet")
+        elif isinstance(default, (int, float)):
+            kw[key] = float(val) if "." in val or "e" in val.lower() else int(val)
+        else:
+            kw[key] = val
+    return kw
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Yumuşatma stratejileri: gecikme / titreşim karşılaştırması")
+    ap.add_argument("--trace", help="CSV iz (t,x,y,target); verilmezse kalibrasyon oturumu")
+    ap.add_argument("--cal", default=CALIB_PATH, help="kalibrasyon oturumu")
+    ap.add_argument("--model", default=MODEL_NPZ_PATH, help="kalibrasyon katsayı dosyası (.npz)")
+    ap.add_argument("--filter", action="append", choices=list(FILTERS), help="sadece bu strateji(ler)")
+    ap.add_argument("--set", action="append", metavar="AD=DEĞER", help="TrackerParams alanı (ör. euro_beta=0.02)")
+    ap.add_argument("--max-jitter", type=float, default=MAX_JITTER_PX, help="seçim için titreşim sınırı (px)")
+    args = ap.parse_args()
+
+    trace = trace_from_csv(args.trace) if args.trace else trace_from_calibration(args.cal, args.model)
+    params = DEFAULT_PARAMS._replace(**_parse_set(args.set))
+    results = evaluate(trace, params, args.filter)
+
+    print(f"{len(trace[0])} örnek, {len(np.unique(trace[3]))} hedef")
+    print(f"{'filtre':<10} {'gecikme ms':>11} {'titreşim px':>12} {'µs/kare':>8}")
+    for name, r in sorted(results.items(), key=lambda kv: kv[1]["lag_ms"]):
+        print(f"{name:<10} {r['lag_ms']:>11.0f} {r['jitter_px']:>12.2f} {r['us']:>8.1f}")
+
+    # "none" sadece karşılaştırma içindir
+    ok = {n: r for n, r in results.items() if n != "none" and r["jitter_px"] <= args.max_jitter}
+    if ok:
+        best = min(ok, key=lambda n: ok[n]["lag_ms"])
+        print(f"✅ Önerilen: filter=\"{best}\" (titreşim ≤ {args.max_jitter} px)")
+    else:
+        print(f"⚠️ Titreşim sınırını ({args.max_jitter} px) sağlayan strateji yok; --max-jitter veya --set ile ayarları deneyin.")
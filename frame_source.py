@@ -0,0 +1,236 @@
+# src/frame_source.py
+import os, sys, time
+import cv2, numpy as np
+
+# Tüm kaynaklar cv2.VideoCapture ile aynı küçük arayüzü sunar:
+#   read(image=None) -> (ok, frame), set(prop, value), isOpened(), release()
+# Böylece CameraCapture ve scriptler kaynağın ne olduğunu bilmek zorunda kalmaz.
+
+IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".bmp")
+
+
+def _camera_backend():
+    """Platforma uygun yakalama backend'i (Windows: DSHOW, Linux: V4L2)."""
+    if sys.platform.startswith("win"):
+        return cv2.CAP_DSHOW
+    if sys.platform.startswith("linux"):
+        return cv2.CAP_V4L2
+    if sys.platform == "darwin":
+        return cv2.CAP_AVFOUNDATION
+    return cv2.CAP_ANY
+
+
+def _into(image, frame):
+    """Verilen tampona kopyala (şekil uyuyorsa), değilse kareyi olduğu gibi döndür."""
+    if image is not None and image.shape == frame.shape:
+        np.copyto(image, frame)
+        return image
+    return frame
+
+
+class _Pacer:
+    """Kaydı doğal hızında (fps) oynatmak için kare başına bekler."""
+
+    def __init__(self, fps):
+        self.period = 1.0 / fps if fps and fps > 0 else 0.0
+        self.next_t = None
+
+    def wait(self):
+        if not self.period:
+            return
+        now = time.perf_counter()
+        if self.next_t is None:
+            self.next_t = now
+        elif now < self.next_t:
+            time.sleep(self.next_t - now)
+        else:
+            # geride kaldıysak biriktirme, saati yeniden hizala
+            self.next_t = max(self.next_t, now - self.period)
+        self.next_t += self.period
+
+
+class FrameSource:
+    """
+    Kare kaynağı temel sınıfı.
+      • realtime=True  → kaynak doğal hızında kare verir (canlı kamera gibi)
+      • realtime=False → kareler olabildiğince hızlı verilir (benchmark/test)
+    frame_time: son okunan karenin zamanı (s). Kayıtlarda medya zamanıdır; böylece
+    hızlı oynatmada da kırpma pencereleri gibi zamanlamalar kayıttaki gibi çalışır.
+    """
+    realtime = True
+    fps = 30.0
+    frame_time = 0.0
+
+    def read(self, image=None):
+        raise NotImplementedError
+
+    def set(self, prop, value):
+        return False
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_FPS:
+            return self.fps
+        return 0.0
+
+    def isOpened(self):
+        return True
+
+    def release(self):
+        pass
+
+
+class CameraSource(FrameSource):
+    """Canlı web kamerası (Windows'ta DSHOW, Linux'ta V4L2)."""
+
+    def __init__(self, index=0, width=640, height=480, fourcc=None):
+        self.cap = cv2.VideoCapture(index, _camera_backend())
+        if fourcc:
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30.0
+
+    def read(self, image=None):
+        ok, frame = self.cap.read() if image is None else self.cap.read(image)
+        self.frame_time = time.time()
+        return ok, frame
+
+    def set(self, prop, value):
+        return self.cap.set(prop, value)
+
+    def get(self, prop):
+        return self.cap.get(prop)
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def release(self):
+        self.cap.release()
+
+
+class VideoFileSource(FrameSource):
+    """Kaydedilmiş video dosyası (mp4/avi...)."""
+
+    def __init__(self, path, realtime=True, loop=False):
+        self.path = path
+        self.cap = cv2.VideoCapture(path)
+        self.realtime = realtime
+        self.loop = loop
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30.0
+        self._n = 0
+        self._pacer = _Pacer(self.fps if realtime else 0)
+
+    def read(self, image=None):
+        self._pacer.wait()
+        ok, frame = self.cap.read() if image is None else self.cap.read(image)
+        if not ok and self.loop:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ok, frame = self.cap.read() if image is None else self.cap.read(image)
+        if ok:
+            self.frame_time = self._n / self.fps
+            self._n += 1
+        return ok, frame
+
+    def get(self, prop):
+        return self.cap.get(prop)
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def release(self):
+        self.cap.release()
+
+
+class ImageDirSource(FrameSource):
+    """Bir klasördeki resimler (isim sırasıyla) kare dizisi olarak."""
+
+    def __init__(self, path, fps=30.0, realtime=True, loop=False):
+        self.files = sorted(
+            os.path.join(path, f) for f in os.listdir(path)
+            if f.lower().endswith(IMAGE_EXTS)
+        )
+        self.fps = fps
+        self.realtime = realtime
+        self.loop = loop
+        self._i = 0
+        self._n = 0
+        self._pacer = _Pacer(fps if realtime else 0)
+
+    def read(self, image=None):
+        if self._i >= len(self.files):
+            if not self.loop or not self.files:
+                return False, None
+            self._i = 0
+        self._pacer.wait()
+        frame = cv2.imread(self.files[self._i])
+        self._i += 1
+        if frame is None:
+            return False, None
+        self.frame_time = self._n / self.fps
+        self._n += 1
+        return True, _into(image, frame)
+
+    def isOpened(self):
+        return bool(self.files)
+
+
+class SyntheticSource(FrameSource):
+    """
+    Kamera gerektirmeyen deterministik kare üreteci.
+    Gri zemin üzerinde dairesel hareket eden parlak bir nokta çizer; yüz içermez,
+    bu yüzden pipeline'ın "yüz yok" yolunu ve ham throughput'u ölçmek içindir.
+    """
+
+    def __init__(self, width=640, height=480, fps=30.0, n_frames=None, realtime=True):
+        self.width, self.height = width, height
+        self.fps = fps
+        self.n_frames = n_frames
+        self.realtime = realtime
+        self._i = 0
+        self._base = np.full((height, width, 3), 96, dtype=np.uint8)
+        self._frame = np.empty_like(self._base)
+        self._pacer = _Pacer(fps if realtime else 0)
+
+    def read(self, image=None):
+        if self.n_frames is not None and self._i >= self.n_frames:
+            return False, None
+        self._pacer.wait()
+        out = image if image is not None and image.shape == self._base.shape else self._frame
+        np.copyto(out, self._base)
+        t = self._i / self.fps
+        cx = int(self.width / 2 + self.width / 3 * np.cos(t))
+        cy = int(self.height / 2 + self.height / 3 * np.sin(t))
+        cv2.circle(out, (cx, cy), 12, (255, 255, 255), -1)
+        self.frame_time = t
+        self._i += 1
+        return True, out
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return float(self.width)
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return float(self.height)
+        return super().get(prop)
+
+
+def open_source(spec=0, realtime=True, loop=False, width=640, height=480, fourcc=None):
+    """
+    Kaynak tanımından FrameSource oluşturur:
+      • 0, "1"                → canlı kamera (indeks)
+      • "synthetic[:N]"       → sentetik üreteç (opsiyonel N kare)
+      • klasör yolu           → resim dizisi
+      • dosya yolu            → video dosyası
+    Kamera her zaman gerçek zamanlıdır; realtime=False sadece kayıtlar için geçerlidir.
+    """
+    if isinstance(spec, FrameSource):
+        return spec
+    if isinstance(spec, int) or (isinstance(spec, str) and spec.isdigit()):
+        return CameraSource(int(spec), width, height, fourcc=fourcc)
+    if spec.startswith("synthetic"):
+        _, _, n = spec.partition(":")
+        return SyntheticSource(width, height, n_frames=int(n) if n else None, realtime=realtime)
+    if os.path.isdir(spec):
+        return ImageDirSource(spec, realtime=realtime, loop=loop)
+    if os.path.isfile(spec):
+        return VideoFileSource(spec, realtime=realtime, loop=loop)
+    raise ValueError(f"Kare kaynağı bulunamadı: {spec}")
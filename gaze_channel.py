@@ -0,0 +1,38 @@
+# src/gaze_channel.py
+import time
+
+# Takip motoru → GUI bakış kanalı (tek yazan, tek okuyan, kilitsiz).
+# Motor her karede filtrelenmiş imleç hedefini buraya yazar; klavye işletim sistemi
+# imlecini yoklamak yerine örneği doğrudan okur. Tek yuva: okuyucu geride kalırsa
+# sadece en yeni örnek görülür, eski örnekler birikmez.
+
+
+class GazeChannel:
+    """
+    publish(x, y, t) → motor thread'i; örnek tek referans atamasıyla yazılır.
+    take()           → GUI thread'i; en yeni (x, y, t) veya hiç örnek yoksa None.
+    notify: okuyucu son örneği aldıktan sonraki İLK yeni örnekte çağrılır
+            (ör. pyqtSignal.emit) → GUI'ye kare başına en fazla bir bekleyen bildirim.
+    """
+
+    def __init__(self, notify=None):
+        self.notify = notify
+        self.sample = None      # (x, y, t)
+        self.seq = 0
+        self._pending = False
+
+    def publish(self, x, y, t=None):
+        self.sample = (x, y, time.time() if t is None else t)
+        self.seq += 1
+        if not self._pending:
+            self._pending = True
+            if self.notify is not None:
+                self.notify()
+
+    def take(self):
+        self._pending = False   # önce bayrak: arada gelen örnek yeni bildirim üretir
+        return self.sample
+
+    def clear(self):
+        self.sample = None
+        self._pending = False
@@ -0,0 +1,179 @@
+# src/gaze_filters.py
+import math
+
+# İmleç yumuşatma stratejileri. Hepsi aynı küçük arayüzü sunar:
+#   reset(x, y, t)   → durumu verilen noktaya kurar (ilk kare / strateji değişimi)
+#   update(x, y, t)  → kalibrasyon modelinin ham hedefiyle bir adım; çıkış self.x, self.y (int)
+#   configure(p)     → TrackerParams'tan kendi ayarlarını okur (çalışırken değişebilir)
+# Durum __slots__ içindeki sayılardır; kare başına liste/dizi oluşturulmaz.
+#
+#   legacy   → eski zincir: hız kazancı, deadzone, max-step, far_dist'e göre iki seviyeli EMA
+#   one_euro → One Euro (Casiez vd. 2012): yavaşken düşük kesim frekansı (titreşim az),
+#              hızlanınca kesim yükselir (gecikme az)
+#   kalman   → sabit hızlı Kalman; iki eksen aynı kovaryansı paylaşır; isteğe bağlı öngörü (lead)
+#   none     → filtresiz (karşılaştırma için)
+
+
+class RawFilter:
+    __slots__ = ("x", "y")
+    name = "none"
+
+    def __init__(self, p=None):
+        self.x = self.y = 0
+
+    def configure(self, p):
+        pass
+
+    def reset(self, x, y, t):
+        self.x, self.y = int(x), int(y)
+
+    def update(self, x, y, t):
+        self.x, self.y = int(x), int(y)
+
+
+class LegacyFilter:
+    """Önceki eye_mouse_calibrated hareket kodu (sens_gain, deadzone_px, max_step_px, far_dist, alpha_far, smoothing)."""
+
+    __slots__ = ("x", "y", "gain", "deadzone", "max_step", "far_dist", "alpha_far", "alpha_near")
+    name = "legacy"
+
+    def __init__(self, p):
+        self.x = self.y = 0
+        self.configure(p)
+
+    def configure(self, p):
+        self.gain = p.sens_gain
+        self.deadzone = p.deadzone_px
+        self.max_step = p.max_step_px
+        self.far_dist = p.far_dist
+        self.alpha_far = p.alpha_far
+        self.alpha_near = p.smoothing
+
+    def reset(self, x, y, t):
+        self.x, self.y = int(x), int(y)
+
+    def update(self, x, y, t):
+        px, py = self.x, self.y
+        # fark + hız kazancı
+        dx = (x - px) * self.gain
+        dy = (y - py) * self.gain
+        # deadzone
+        if abs(dx) < self.deadzone: dx = 0
+        if abs(dy) < self.deadzone: dy = 0
+        # max step
+        dx = max(-self.max_step, min(dx, self.max_step))
+        dy = max(-self.max_step, min(dy, self.max_step))
+        # uzak/ yakın adaptif smoothing
+        dist = math.hypot(x - px, y - py)
+        alpha = self.alpha_far if dist > self.far_dist else self.alpha_near
+        self.x = int(px * (1 - alpha) + (px + dx) * alpha)
+        self.y = int(py * (1 - alpha) + (py + dy) * alpha)
+
+
+def _alpha(dt, cutoff):
+    tau = 1.0 / (2.0 * math.pi * cutoff)
+    return 1.0 / (1.0 + tau / dt)
+
+
+class OneEuroFilter:
+    """
+    min_cutoff (Hz): durağan bakışta kesim → küçük = daha az titreşim
+    beta (1/px):     hız başına kesim artışı → büyük = hızlı harekette daha az gecikme
+    Hız iki eksen için ortak (hypot) → köşegen hareketler eksene bağlı davranmaz.
+    """
+
+    __slots__ = ("x", "y", "fx", "fy", "dx", "dy", "t", "min_cutoff", "beta", "d_cutoff")
+    name = "one_euro"
+
+    def __init__(self, p, d_cutoff=1.0):
+        self.d_cutoff = d_cutoff
+        self.configure(p)
+        self.reset(0, 0, 0.0)
+
+    def configure(self, p):
+        self.min_cutoff = p.euro_min_cutoff
+        self.beta = p.euro_beta
+
+    def reset(self, x, y, t):
+        self.fx, self.fy = float(x), float(y)
+        self.dx = self.dy = 0.0
+        self.t = t
+        self.x, self.y = int(x), int(y)
+
+    def update(self, x, y, t):
+        dt = t - self.t
+        if dt <= 0:
+            dt = 1.0 / 30
+        self.t = t
+        a = _alpha(dt, self.d_cutoff)
+        self.dx += a * ((x - self.fx) / dt - self.dx)
+        self.dy += a * ((y - self.fy) / dt - self.dy)
+        a = _alpha(dt, self.min_cutoff + self.beta * math.hypot(self.dx, self.dy))
+        self.fx += a * (x - self.fx)
+        self.fy += a * (y - self.fy)
+        self.x, self.y = int(self.fx), int(self.fy)
+
+
+class KalmanFilter:
+    """
+    Durum (konum, hız) her eksen için; ölçüm: konum.
+    q (px²/s³): ivme gürültüsü → büyük = sakkadlara hızlı uyum, daha çok titreşim
+    r (px²):    ölçüm gürültüsü → büyük = daha düzgün, daha gecikmeli
+    lead (s):   çıkış = konum + hız × lead (boru hattı gecikmesini telafi; 0 → kapalı)
+    """
+
+    __slots__ = ("x", "y", "px", "py", "vx", "vy", "P11", "P12", "P22", "t", "q", "r", "lead")
+    name = "kalman"
+
+    def __init__(self, p):
+        self.configure(p)
+        self.reset(0, 0, 0.0)
+
+    def configure(self, p):
+        self.q = p.kalman_q
+        self.r = p.kalman_r
+        self.lead = p.kalman_lead
+
+    def reset(self, x, y, t):
+        self.px, self.py = float(x), float(y)
+        self.vx = self.vy = 0.0
+        self.P11, self.P12, self.P22 = self.r, 0.0, 1e6
+        self.t = t
+        self.x, self.y = int(x), int(y)
+
+    def update(self, x, y, t):
+        dt = t - self.t
+        if dt <= 0:
+            dt = 1.0 / 30
+        self.t = t
+        q = self.q
+        # tahmin
+        self.px += self.vx * dt
+        self.py += self.vy * dt
+        P11 = self.P11 + dt * (2 * self.P12 + dt * self.P22) + q * dt ** 3 / 3
+        P12 = self.P12 + dt * self.P22 + q * dt ** 2 / 2
+        P22 = self.P22 + q * dt
+        # düzeltme (kazanç iki eksende aynı)
+        S = P11 + self.r
+        K1, K2 = P11 / S, P12 / S
+        ex, ey = x - self.px, y - self.py
+        self.px += K1 * ex
+        self.py += K1 * ey
+        self.vx += K2 * ex
+        self.vy += K2 * ey
+        self.P11 = (1 - K1) * P11
+        self.P12 = (1 - K1) * P12
+        self.P22 = P22 - K2 * P12
+        self.x = int(self.px + self.vx * self.lead)
+        self.y = int(self.py + self.vy * self.lead)
+
+
+FILTERS = {f.name: f for f in (LegacyFilter, OneEuroFilter, KalmanFilter, RawFilter)}
+
+
+def make_filter(p):
+    """TrackerParams.filter adıyla strateji nesnesi."""
+    try:
+        return FILTERS[p.filter](p)
+    except KeyError:
+        raise ValueError(f"Bilinmeyen filtre: {p.filter} (seçenekler: {', '.join(FILTERS)})") from None
@@ -0,0 +1,83 @@
+# src/gaze_hit_index.py
+from PyQt5.QtCore import QObject, QEvent, QPoint
+
+# Bakış noktası → buton araması için ızgara indeksi.
+# Butonların dikdörtgenleri kök widget'a göre BİR KEZ hesaplanır ve hücrelere dağıtılır;
+# her bakış örneği tek mapFromGlobal + tek hücre aramasıdır. Kök widget'a göreli tutulduğu
+# için pencere taşınınca yeniden hesap gerekmez. İndeks sadece yerleşim değişince
+# (boyut/konum değişimi, sayfa değişimi, göster/gizle, etkin/pasif) geçersiz olur.
+
+_INVALIDATING = (
+    QEvent.Move, QEvent.Resize, QEvent.Show, QEvent.Hide,
+    QEvent.EnabledChange, QEvent.ParentChange, QEvent.LayoutRequest,
+)
+
+
+class GazeHitIndex(QObject):
+    """
+    root: koordinat referansı olan widget (klavye).
+    add(button) ile butonlar kaydedilir; hit(gx, gy) global noktadaki görünür ve
+    etkin butonu (veya None) döndürür.
+    """
+
+    def __init__(self, root, cell=64):
+        super().__init__(root)
+        self.root = root
+        self.cell = cell
+        self.buttons = []
+        self._grid = {}          # (cx, cy) → [(x0, y0, x1, y1, buton), ...]
+        self._watched = set()    # event filter kurulan widget'lar
+        self._dirty = True
+        self.rebuilds = 0
+        self._watch(root)
+
+    def _watch(self, w):
+        if id(w) not in self._watched:
+            self._watched.add(id(w))
+            w.installEventFilter(self)
+
+    def add(self, button):
+        self.buttons.append(button)
+        self._watch(button)
+        self._dirty = True
+
+    def invalidate(self):
+        self._dirty = True
+
+    def eventFilter(self, obj, ev):
+        # Kökün kendi taşınması indeksi bozmaz (koordinatlar köke göreli)
+        if ev.type() in _INVALIDATING and not (obj is self.root and ev.type() == QEvent.Move):
+            self._dirty = True
+        return False
+
+    def _rebuild(self):
+        grid, cell, root = {}, self.cell, self.root
+        for b in self.buttons:
+            # Butonla kök arasındaki tüm ara widget'lar (satırlar, sayfalar) da izlenir:
+            # bir üst widget kayınca butonun kendi Move olayı gelmez.
+            p = b.parentWidget()
+            while p is not None and p is not root:
+                self._watch(p)
+                p = p.parentWidget()
+            if not b.isVisible() or not b.isEnabled():
+                continue
+            o = b.mapTo(root, QPoint(0, 0))
+            x0, y0 = o.x(), o.y()
+            x1, y1 = x0 + b.width(), y0 + b.height()
+            entry = (x0, y0, x1, y1, b)
+            for cy in range(y0 // cell, (y1 - 1) // cell + 1):
+                for cx in range(x0 // cell, (x1 - 1) // cell + 1):
+                    grid.setdefault((cx, cy), []).append(entry)
+        self._grid = grid
+        self._dirty = False
+        self.rebuilds += 1
+
+    def hit(self, gx, gy):
+        if self._dirty:
+            self._rebuild()
+        p = self.root.mapFromGlobal(QPoint(int(gx), int(gy)))
+        x, y = p.x(), p.y()
+        for x0, y0, x1, y1, b in self._grid.get((x // self.cell, y // self.cell), ()):
+            if x0 <= x < x1 and y0 <= y < y1:
+                return b
+        return None
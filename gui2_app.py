@@ -1,5 +1,4 @@
 import sys
-import threading
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QPushButton, QLabel, QVBoxLayout,
     QSlider, QHBoxLayout, QTabWidget, QCheckBox, QFrame,
@@ -133,7 +132,7 @@ class ModernEyeMouse(QWidget):
         
         # Application State
         self.running = False
-        self.thread = None
+        self.engine = None  # camera/model/FaceMesh stay open between start/stop
 
         # Main Layout
         main_layout = QVBoxLayout()
@@ -289,12 +288,6 @@ class ModernEyeMouse(QWidget):
     def start_eye_mouse(self):
         if self.running:
             return
-            
-        self.running = True
-        self.btn_start.setEnabled(False)
-        self.btn_stop.setEnabled(True)
-        self.status_label.setText("DURUM: ÇALIŞIYOR (KAMERA AÇIK)")
-        self.status_label.setStyleSheet("font-size: 18px; font-weight: bold; color: #a6e3a1;") # Green
 
         # Get values
         smoothing      = self.sliders["smoothing"].value()   / 100
@@ -303,30 +296,36 @@ class ModernEyeMouse(QWidget):
         dbl_window_sec = self.sliders["dbl_window"].value()  / 100
         enable_rc      = self.chk_right_click.isChecked()
 
-        def run():
-            try:
-                eye_mouse.main(
-                    smoothing=smoothing,
-                    ear_click_th=ear_th,
-                    click_cooldown=refractory,
-                    enable_right_click=enable_rc,
-                    dbl_blink_window=dbl_window_sec
-                )
-            except Exception as e:
-                print(f"Error: {e}")
-            finally:
-                # When main loop exits
-                self.stop_visuals()
-
-        self.thread = threading.Thread(target=run, daemon=True)
-        self.thread.start()
+        if self.engine is None:
+            self.engine = eye_mouse.EyeMouseEngine()
+        self.engine.update(
+            smoothing=smoothing,
+            ear_click_th=ear_th,
+            click_cooldown=refractory,
+            enable_right_click=enable_rc,
+            dbl_blink_window=dbl_window_sec
+        )
+        # When the engine loop exits (camera lost, 'q' in preview)
+        # A previous session still shutting down is joined by start() (its stop_visuals runs
+        # then), so the running state is set only after start() returns
+        self.engine.start(show_preview=True, stopped_callback=self.stop_visuals)
+        self.running = True
+        self.btn_start.setEnabled(False)
+        self.btn_stop.setEnabled(True)
+        self.status_label.setText("DURUM: ÇALIŞIYOR (KAMERA AÇIK)")
+        self.status_label.setStyleSheet("font-size: 18px; font-weight: bold; color: #a6e3a1;") # Green
 
     def stop_eye_mouse(self):
         if self.running:
-            eye_mouse.stop()
+            self.engine.stop()
             # UI updates will happen in stop_visuals called by thread exiting or manual trigger
             self.stop_visuals()
 
+    def closeEvent(self, event):
+        if self.engine is not None:
+            self.engine.close()
+        super().closeEvent(event)
+
     def stop_visuals(self):
         self.running = False
         # Use QTimer to safely update UI from another thread if needed, 
@@ -1,4 +1,4 @@
-import sys, threading
+import sys
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QPushButton, QLabel, QVBoxLayout,
     QSlider, QHBoxLayout, QTabWidget, QCheckBox, QSplashScreen
@@ -15,7 +15,7 @@ class EyeMouseApp(QWidget):
         self.setGeometry(100, 100, 900, 650)
 
         self.running = False
-        self.thread = None
+        self.engine = None   # kamera/model/FaceMesh başlat-durdur arasında açık kalır
 
         tabs = QTabWidget()
         tabs.addTab(self.create_control_tab(), "Kontrol")
@@ -114,8 +114,6 @@ class EyeMouseApp(QWidget):
     def start_eye_mouse(self):
         if self.running:
             return
-        self.running = True
-        self.label.setText("Durum: Çalışıyor...")
 
         smoothing      = self.slider_smoothing["slider"].value()   / 100
         ear_th         = self.slider_ear["slider"].value()         / 100
@@ -125,27 +123,38 @@ class EyeMouseApp(QWidget):
         enable_right_click = self.chk_right_click.isChecked()
         enable_double_click = self.chk_double_click.isChecked()
 
-        def run():
-            eye_mouse.main(
-                smoothing=smoothing,
-                ear_click_th=ear_th,
-                click_cooldown=refractory,
-                enable_right_click=enable_right_click,
-                enable_double_click=enable_double_click,
-                dbl_blink_window=dbl_window_sec
-            )
-            self.label.setText("Durum: Beklemede")
+        def on_stopped():
+            if self.running:
+                self.label.setText("Durum: Beklemede")
             self.running = False
 
-        self.thread = threading.Thread(target=run, daemon=True)
-        self.thread.start()
+        if self.engine is None:
+            self.engine = eye_mouse.EyeMouseEngine()
+        self.engine.update(
+            smoothing=smoothing,
+            ear_click_th=ear_th,
+            click_cooldown=refractory,
+            enable_right_click=enable_right_click,
+            enable_double_click=enable_double_click,
+            dbl_blink_window=dbl_window_sec
+        )
+        # Önceki oturum hâlâ kapanıyorsa start() onu bekler (on_stopped o sırada çalışır);
+        # durum bu yüzden start()'tan SONRA ayarlanır
+        self.engine.start(show_preview=True, stopped_callback=on_stopped)
+        self.running = True
+        self.label.setText("Durum: Çalışıyor...")
 
     def stop_eye_mouse(self):
         if self.running:
-            eye_mouse.stop()
+            self.engine.stop()
             self.label.setText("Durum: Durduruldu")
             self.running = False
 
+    def closeEvent(self, event):
+        if self.engine is not None:
+            self.engine.close()
+        super().closeEvent(event)
+
     def set_dark_theme(self):
         self.setStyleSheet("""
             QWidget { background-color: #2b2b2b; color: #ffffff; }
@@ -1,17 +1,16 @@
 
 import sys
-import threading
-import cv2
-import numpy as np
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QPushButton, QLabel, QVBoxLayout,
     QSlider, QHBoxLayout, QStackedWidget, QFrame, QSizePolicy,
     QGraphicsDropShadowEffect
 )
-from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QEvent
 from PyQt5.QtGui import QImage, QPixmap, QIcon
 
 import eye_mouse_calibrated as eye_mouse
+from metrics import format_metrics
+from preview import PreviewBuffer
 
 # --- Modern Stylesheet (Sidebar & Glassmorphism) ---
 # [class="..."] selector syntax is required when using setProperty("class", ...)
@@ -94,11 +93,22 @@ QLabel[class="Title"] {
     color: #89b4fa;
     margin-bottom: 20px;
 }
+
+/* Metrics line under the camera */
+QLabel#Metrics {
+    color: #a6adc8;
+    font-family: 'Consolas', monospace;
+    font-size: 12px;
+}
 """
 
 class EyeMousePro(QWidget):
     # Video frame sinyali (Thread-safe güncelleme için)
-    frame_signal = pyqtSignal(np.ndarray)
+    frame_signal = pyqtSignal()   # self.preview içinde yeni kare hazır
+    # Gecikme / FPS özeti sinyali
+    metrics_signal = pyqtSignal(dict)
+    # Motor durduğunda (thread içinden) UI'yi güncellemek için
+    stopped_signal = pyqtSignal()
 
     def __init__(self):
         super().__init__()
@@ -107,7 +117,10 @@ class EyeMousePro(QWidget):
         self.setStyleSheet(STYLESHEET)
         
         self.running = False
-        self.thread = None
+        # Motor: kamera, model ve FaceMesh başlat/durdur arasında açık kalır
+        self.engine = None
+        # Önizleme: kare motor thread'inde etiket boyutuna küçültülür, sinyal sadece bildirim taşır
+        self.preview = PreviewBuffer(notify=self.frame_signal.emit)
 
         # Ana Düzen (Sidebar + Content)
         main_layout = QHBoxLayout()
@@ -160,7 +173,10 @@ class EyeMousePro(QWidget):
         # Sinyal Bağlantıları
         self.btn_dashboard.clicked.connect(lambda: self.switch_page(0, self.btn_dashboard))
         self.btn_settings.clicked.connect(lambda: self.switch_page(1, self.btn_settings))
+        self.pages.currentChanged.connect(self.update_preview_active)
         self.frame_signal.connect(self.update_camera_feed)
+        self.metrics_signal.connect(self.update_metrics)
+        self.stopped_signal.connect(self.stop_visuals)
 
     def create_sidebar_btn(self, text, active):
         btn = QPushButton(text)
@@ -178,6 +194,15 @@ class EyeMousePro(QWidget):
         self.btn_settings.setChecked(False)
         active_btn.setChecked(True)
 
+    def update_preview_active(self, _=None):
+        # Kamera sayfası görünmüyorsa (ayarlar / küçültülmüş pencere) motor önizleme hazırlamaz
+        self.preview.set_active(self.pages.currentIndex() == 0 and not self.isMinimized())
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.WindowStateChange:
+            self.update_preview_active()
+        super().changeEvent(event)
+
     # --- Sayfa 1: Dashboard (Kamera) ---
     def create_dashboard_page(self):
         w = QWidget()
@@ -218,9 +243,14 @@ class EyeMousePro(QWidget):
         self.lbl_camera.setText("Kamera Kapalı\nBaşlatmak için yukarıdaki butona basın.")
         self.lbl_camera.setStyleSheet("color: #585b70; font-size: 16px;")
 
+        # Ölçüm satırı (FPS, atlanan kare, aşama gecikmeleri)
+        self.lbl_metrics = QLabel("")
+        self.lbl_metrics.setObjectName("Metrics")
+
         layout.addLayout(top_bar)
         layout.addSpacing(20)
         layout.addWidget(self.lbl_camera)
+        layout.addWidget(self.lbl_metrics)
         
         w.setLayout(layout)
         return w
@@ -269,6 +299,7 @@ class EyeMousePro(QWidget):
         slider.setMaximum(max_v)
         slider.setValue(init_v)
         slider.valueChanged.connect(lambda v: lbl.setText(f"{text}: {v/100:.2f}"))
+        slider.valueChanged.connect(self.push_params)   # çalışırken anında uygula
         
         layout.addWidget(lbl)
         layout.addWidget(slider)
@@ -277,6 +308,21 @@ class EyeMousePro(QWidget):
         self.sliders[key] = slider
 
     # --- Logic ---
+    def slider_params(self):
+        return dict(
+            smoothing=self.sliders["smoothing"].value()           / 100,
+            ear_click_th=self.sliders["ear"].value()              / 100,
+            click_cooldown=self.sliders["cooldown"].value()       / 100,
+            dbl_blink_window=self.sliders["dbl_window"].value()   / 100,
+            sens_gain=self.sliders["sensitivity"].value()         / 10,  # 16 -> 1.6
+            deadzone_px=self.sliders["deadzone"].value(),
+        )
+
+    def push_params(self, _=None):
+        # Takip durdurulmadan: motor yeni değerleri bir sonraki karede kullanır
+        if self.engine is not None:
+            self.engine.update(**self.slider_params())
+
     def start_eye_mouse(self):
         if self.running: return
 
@@ -284,64 +330,62 @@ class EyeMousePro(QWidget):
         self.btn_start.setEnabled(False)
         self.btn_stop.setEnabled(True)
         self.lbl_camera.setText("Kamera Başlatılıyor...")
-
-                # Parametreleri al
-        smoothing      = self.sliders["smoothing"].value()   / 100
-        ear_th         = self.sliders["ear"].value()         / 100
-        refractory     = self.sliders["cooldown"].value()    / 100
-        dbl_window_sec = self.sliders["dbl_window"].value()  / 100
-        sens_gain      = self.sliders["sensitivity"].value() / 10  # 16 -> 1.6
-        deadzone_px    = self.sliders["deadzone"].value()
-
-        def run():
-            try:
-                # show_preview=False çünkü biz GUI'de göstereceğiz
-                eye_mouse.main(
-                    smoothing=smoothing,
-                    ear_click_th=ear_th,
-                    click_cooldown=refractory,
-                    dbl_blink_window=dbl_window_sec,
-                    sens_gain=sens_gain,        # Yeni parametre
-                    deadzone_px=deadzone_px,    # Yeni parametre
-                    enable_right_click=True,
-                    show_preview=False,
-                    frame_callback=self.frame_signal.emit  # Frame'i sinyale gönder
-                )
-            except Exception as e:
-                print(f"Hata: {e}")
-            finally:
-                self.stop_visuals()
-
-        self.thread = threading.Thread(target=run, daemon=True)
-        self.thread.start()
+        r = self.lbl_camera.contentsRect()
+        self.preview.set_target(r.width(), r.height())
+
+        # İlk başlatmada kamera/model/FaceMesh motor thread'inde açılır; sonrakiler anında
+        if self.engine is None:
+            self.engine = eye_mouse.EyeMouseEngine()
+        self.engine.update(**self.slider_params(), enable_right_click=True)
+        # show_preview=False çünkü biz GUI'de göstereceğiz
+        self.engine.start(
+            preview=self.preview,                         # Kare motor thread'inde hazırlanır
+            metrics_callback=self.metrics_signal.emit,    # Ölçüm özetini sinyale gönder
+            stopped_callback=self.stopped_signal.emit,
+        )
 
     def stop_eye_mouse(self):
         if self.running:
-            eye_mouse.stop()
+            self.engine.stop()
             # UI güncellemesi stop_visuals ile yapılacak
+
+    def closeEvent(self, event):
+        # Pencere kapanırken kamerayı ve FaceMesh'i bırak
+        if self.engine is not None:
+            self.engine.close()
+        super().closeEvent(event)
             
     def stop_visuals(self):
+        # Eski oturumun gecikmeli sinyali: bu arada yeni oturum başladıysa yok say
+        if self.engine is not None and self.engine.active:
+            return
         self.running = False
         self.btn_start.setEnabled(True)
         self.btn_stop.setEnabled(False)
         self.lbl_camera.setText("Kamera Kapalı")
+        self.lbl_metrics.setText("")
         # Görüntüyü temizle
 
-    @pyqtSlot(np.ndarray)
-    def update_camera_feed(self, frame):
-        """Backend'den gelen frame'i ekranda göster"""
+    @pyqtSlot(dict)
+    def update_metrics(self, snap):
+        """Backend'den gelen ölçüm özetini göster"""
         if not self.running: return
+        self.lbl_metrics.setText(format_metrics(snap))
 
-        # Frame zaten RGB geliyor (eye_mouse_calibrated içinde çevirdik)
+    @pyqtSlot()
+    def update_camera_feed(self):
+        """Motorun hazırladığı kareyi ekranda göster"""
+        frame = self.preview.take()
+        if frame is None or not self.running: return
+
+        # Kare zaten RGB ve etiket boyutunda geliyor (motor thread'inde küçültüldü)
         h, w, ch = frame.shape
-        bytes_per_line = ch * w
-        qt_img = QImage(frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
-        
-        # Ölçekle ve göster
-        pixmap = QPixmap.fromImage(qt_img)
-        self.lbl_camera.setPixmap(pixmap.scaled(
-            self.lbl_camera.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
-        ))
+        qt_img = QImage(frame.data, w, h, frame.strides[0], QImage.Format_RGB888)
+        self.lbl_camera.setPixmap(QPixmap.fromImage(qt_img))
+
+        # Pencere boyutu değiştiyse sonraki kare yeni boyutta gelsin
+        r = self.lbl_camera.contentsRect()
+        self.preview.set_target(r.width(), r.height())
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -1,19 +1,23 @@
 
 import sys
-import threading
-import cv2
-import numpy as np
 import webbrowser
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QPushButton, QLabel, QVBoxLayout,
     QSlider, QHBoxLayout, QStackedWidget, QFrame, QSizePolicy,
-    QGridLayout, QMainWindow, QShortcut
+    QGridLayout, QMainWindow, QShortcut, QCheckBox
 )
 from PyQt5.QtGui import QKeySequence
-from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QTimer, QPoint, QRect, QSize
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QTimer, QSize, QEvent
 from PyQt5.QtGui import QImage, QPixmap, QIcon, QFont, QCursor, QPainter, QColor
 
 import eye_mouse_calibrated as eye_mouse
+from metrics import format_metrics
+from preview import PreviewBuffer
+from gaze_hit_index import GazeHitIndex
+from dwell_scheduler import DwellScheduler
+from gaze_channel import GazeChannel
+from word_predictor import WordPredictor, LEXICON_PATH
+from ngram_model import NgramModel, NGRAM_PATH, tokenize
 
 # ==========================================
 #  MAIN APP STYLES (SIDEBAR ETC)
@@ -71,6 +75,7 @@ QSlider::groove:horizontal { height: 6px; background: #313244; border-radius: 3p
 QSlider::handle:horizontal { background: #89b4fa; width: 16px; margin: -5px 0; border-radius: 8px; }
 
 QLabel[class="Title"] { font-size: 24px; font-weight: bold; color: #89b4fa; margin-bottom: 20px; }
+QLabel#Metrics { color: #a6adc8; font-family: 'Consolas', monospace; font-size: 12px; }
 """
 
 # ==========================================
@@ -135,63 +140,26 @@ PHRASE_CATEGORIES = [
 ]
 
 class GazeButton(QPushButton):
+    # Dwell timing lives in DwellScheduler; the button only stores and paints its state
     def __init__(self, text="", dwell_ms=1200, repeat=False, parent=None):
         super().__init__(text, parent)
         self.dwell_ms = dwell_ms
         self.repeat = repeat
         self.hovered = False
         self.progress = 0
-        self.fired_while_hovered = False
         self._alive = True
-        self.dwell_timer = QTimer(self)
-        self.dwell_timer.timeout.connect(self._tick)
-        self.repeat_timer = QTimer(self)
-        self.repeat_timer.timeout.connect(self._repeat_click)
         self.setMouseTracking(True)
     
     def cleanup(self):
         self._alive = False
-        try:
-            self.dwell_timer.stop()
-            self.repeat_timer.stop()
-        except: pass
         self.hovered = False
+        self.set_progress(0)
     
-    def start_dwell(self):
-        if not self._alive or not self.isVisible() or not self.isEnabled(): return
-        if not self.hovered:
-            self.hovered = True
-            self.progress = 0
-            self.dwell_timer.start(50)
-            self.update()
-    
-    def stop_dwell(self):
-        if not self._alive: return
-        self.hovered = False
-        self.progress = 0
-        self.dwell_timer.stop()
-        self.repeat_timer.stop()
-        self.update()
-    
-    def _tick(self):
-        if not self._alive: return
-        if self.fired_while_hovered and not self.repeat:
-            self.dwell_timer.stop()
-            return
-        self.progress += 50
-        if self.progress >= self.dwell_ms:
-            self.dwell_timer.stop()
-            self.progress = 0
-            self.fired_while_hovered = True
-            self.click()
-            if self.repeat: self.repeat_timer.start(140)
-        self.update()
-    
-    def _repeat_click(self):
-        if self.hovered and self.repeat and self._alive:
-            self.click()
-        else:
-            self.repeat_timer.stop()
+    def set_progress(self, ms):
+        # Repaint only when the drawn bar width actually changes
+        old = int((self.progress / self.dwell_ms) * self.width())
+        self.progress = ms
+        if int((ms / self.dwell_ms) * self.width()) != old: self.update()
     
     def paintEvent(self, e):
         if not self._alive: return
@@ -211,6 +179,15 @@ class EyeKeyboard(QWidget):
         self.simulation_mode = True
         self.current_view = "letters"
         self.all_buttons = []
+        self.hit_index = GazeHitIndex(self)  # cached button rects, rebuilt only on layout changes
+        self.dwell = DwellScheduler(self)    # one dwell timer for the whole keyboard
+        self.gaze_channel = None             # direct tracker feed (None → cursor polling)
+        self.confirm_target = None           # engine.confirm_target: centres of dwell-selected keys
+        # Frequency-ranked completions; falls back to TURKISH_WORDS when no lexicon file exists
+        self.predictor = WordPredictor.load(LEXICON_PATH, fallback=TURKISH_WORDS)
+        # Next-word model: seeded from the phrase pages, keeps learning from what is typed
+        self.ngram = NgramModel.load(NGRAM_PATH, seed=[p for _, ps in PHRASE_CATEGORIES for p in ps])
+        self._unsaved_words = 0
         self.gaze_x = 0
         self.gaze_y = 0
         
@@ -338,6 +315,7 @@ class EyeKeyboard(QWidget):
         b.setProperty("value", text)
         b.clicked.connect(self.on_button_clicked)
         self.all_buttons.append(b)
+        self.hit_index.add(b)
         return b
 
     def _make_key(self, text, action="CHAR", w=120, h=95, repeat=False, style=""):
@@ -422,6 +400,10 @@ class EyeKeyboard(QWidget):
     def on_button_clicked(self):
         btn = self.sender()
         if not btn: return
+        # A key fired by tracker dwell is where the user was looking → its centre recalibrates the engine
+        if self.confirm_target is not None and not self.simulation_mode and btn is self.dwell.target and not btn.repeat:
+            c = btn.mapToGlobal(btn.rect().center())
+            self.confirm_target(c.x(), c.y())
         action = btn.property("action")
         value = btn.property("value")
 
@@ -439,10 +421,15 @@ class EyeKeyboard(QWidget):
             return
 
         if action == "CHAR": self.text += str(value)
-        elif action == "SPACE": self.text += " "
+        elif action == "SPACE":
+            committed = bool(self.text) and not self.text.endswith(" ")
+            self.text += " "
+            if committed: self._learn_words(1)
         elif action == "DEL": self.text = self.text[:-1]
         elif action == "CLEAR": self.text = ""
-        elif action == "PHRASE": self.text += str(value) + " "
+        elif action == "PHRASE":
+            self.text += str(value) + " "
+            self._learn_words(len(tokenize(str(value))))
         elif action == "SUGGESTION":
             word = str(value).strip()
             if word: self.select_suggestion(word)
@@ -457,27 +444,44 @@ class EyeKeyboard(QWidget):
 
     def select_suggestion(self, word):
         parts = self.text.split()
-        if parts and not self.text.endswith(" "): parts[-1] = word
+        if parts and not self.text.endswith(" "):
+            parts[-1] = word
+            self.text = " ".join(parts) + " "
         else: self.text += word + " "
-        self.text += " "
+        self._learn_words(1)
         self._refresh_text()
 
+    def _learn_words(self, new):
+        # Feed the last `new` committed words (with their context) to the n-gram model
+        words = tokenize(self.text)
+        if not words: return
+        self.ngram.learn(words, new)
+        self._unsaved_words += new
+        if self._unsaved_words >= 20: self.save_ngram()
+
+    def save_ngram(self):
+        if not self.ngram.dirty: return
+        try:
+            self.ngram.save(NGRAM_PATH)
+            self._unsaved_words = 0
+        except OSError as e:
+            print(f"N-gram model could not be saved: {e}")
+
     def _refresh_text(self):
         self.text_display.setText(self.text if self.text else "Yazmaya başlamak için harflere bakın...")
         
     def update_suggestions(self):
         words = self.text.split()
-        current = words[-1].upper() if words and not self.text.endswith(" ") else ""
-        sug_list = []
+        current = words[-1] if words and not self.text.endswith(" ") else ""
         if current:
-            for L in range(len(current), 0, -1):
-                pref = current[:L]
-                if pref in TURKISH_WORDS:
-                    for w in TURKISH_WORDS[pref]:
-                        if w.upper().startswith(current) and w not in sug_list:
-                            sug_list.append(w)
+            sug_list = self.predictor.complete(current, len(self.suggestion_buttons))
         else:
-            sug_list = ["Merhaba", "Günaydın", "Teşekkür", "Lütfen", "Evet", "Hayır", "Yardım", "Doktor", "Su", "Tamam"]
+            # Word finished → predict the next one from context, pad with the fixed list
+            n = len(self.suggestion_buttons)
+            sug_list = self.ngram.predict(tokenize(self.text), n)
+            for w in ["Merhaba", "Günaydın", "Teşekkür", "Lütfen", "Evet", "Hayır", "Yardım", "Doktor", "Su", "Tamam"]:
+                if len(sug_list) >= n: break
+                if w not in sug_list: sug_list.append(w)
         
         for i, b in enumerate(self.suggestion_buttons):
             if i < len(sug_list):
@@ -505,25 +509,36 @@ class EyeKeyboard(QWidget):
             self.btn_sim.setText("👁 Sim OFF")
             self.btn_sim.setStyleSheet("background-color: #555555; border-radius: 18px; font-size: 16px;")
 
+    def attach_gaze(self, channel, confirm_target=None):
+        # Direct feed from the tracker turns cursor polling off; None restores it
+        self.gaze_channel = channel
+        self.confirm_target = confirm_target
+        if (channel is not None) == self.simulation_mode: self.toggle_sim()
+
+    def on_gaze_sample(self):
+        # Called once per tracker frame: select keys without waiting for the poll timer
+        s = self.gaze_channel.take() if self.gaze_channel is not None else None
+        if s is None or self.simulation_mode: return
+        self.gaze_x, self.gaze_y = int(s[0]), int(s[1])
+        self.dwell.focus(self.hit_index.hit(self.gaze_x, self.gaze_y))
+
     def _check_gaze(self):
         if self.simulation_mode:
             pos = QCursor.pos()
             self.gaze_x = pos.x()
             self.gaze_y = pos.y()
-        for b in self.all_buttons:
-             if not b.isVisible() or not b.isEnabled():
-                 b.stop_dwell()
-                 continue
-             g = b.mapToGlobal(QPoint(0,0))
-             if QRect(g, b.size()).contains(self.gaze_x, self.gaze_y): b.start_dwell()
-             else: b.stop_dwell()
+        # Single grid lookup per sample; dwell only changes when the gazed button changes
+        self.dwell.focus(self.hit_index.hit(self.gaze_x, self.gaze_y))
 
 
 # ==========================================
 #  MAIN APP (GUI V4) - INTEGRATION
 # ==========================================
 class EyeMouseAppV4(QWidget):
-    frame_signal = pyqtSignal(np.ndarray)
+    frame_signal = pyqtSignal()   # a new preview frame is ready in self.preview
+    metrics_signal = pyqtSignal(dict)
+    stopped_signal = pyqtSignal()
+    gaze_signal = pyqtSignal()    # a new gaze sample is waiting in self.gaze_channel
 
     def __init__(self):
         super().__init__()
@@ -532,7 +547,12 @@ class EyeMouseAppV4(QWidget):
         self.setStyleSheet(MAIN_STYLESHEET)
         
         self.running = False
-        self.thread = None
+        # Tracker engine: camera, model and FaceMesh stay warm between start/stop
+        self.engine = None
+        # Preview frames are resized/converted in the tracker thread; only a notification crosses threads
+        self.preview = PreviewBuffer(notify=self.frame_signal.emit)
+        # Filtered gaze goes straight to the keyboard (no OS cursor round trip)
+        self.gaze_channel = GazeChannel(notify=self.gaze_signal.emit)
 
         # --- ROOT LAYOUT ---
         # We use a StackedLayout at the VERY TOP
@@ -585,6 +605,7 @@ class EyeMouseAppV4(QWidget):
         # --- PAGE 2: KEYBOARD (Global) ---
         self.full_keyboard = EyeKeyboard()
         self.full_keyboard.request_back.connect(self.go_back_to_dashboard)
+        self.gaze_signal.connect(self.full_keyboard.on_gaze_sample)
         
         # Add to Main Stack
         self.main_stack.addWidget(self.dashboard_widget) # Index 0
@@ -595,8 +616,14 @@ class EyeMouseAppV4(QWidget):
         self.btn_set.clicked.connect(lambda: self._nav_dashboard(1))
         self.btn_key.clicked.connect(self.switch_to_keyboard)
         
+        # Preview runs only while the camera page is actually on screen
+        self.main_stack.currentChanged.connect(self._update_preview_active)
+        self.content_stack.currentChanged.connect(self._update_preview_active)
+
         # Signals
         self.frame_signal.connect(self.update_feed)
+        self.metrics_signal.connect(self.update_metrics)
+        self.stopped_signal.connect(self.stop_visuals)
         
         # Shortcut: 'Q' to Stop
         self.shortcut_stop = QShortcut(QKeySequence("Q"), self)
@@ -624,16 +651,38 @@ class EyeMouseAppV4(QWidget):
         # Switch to Page 1 (Full Screen Keyboard)
         self.main_stack.setCurrentIndex(1)
         self.btn_key.setChecked(True) # Visual only, though sidebar hidden
+        if self.running:
+            self.gaze_channel.clear()
+            self.full_keyboard.attach_gaze(self.gaze_channel, self.engine.confirm_target)
+            self.engine.update(os_cursor=not self.chk_freeze.isChecked())
         
     def go_back_to_dashboard(self):
         # Return to Page 0
         self.main_stack.setCurrentIndex(0)
+        self._detach_keyboard_gaze()
         # Restore button states
         idx = self.content_stack.currentIndex()
         self.btn_cam.setChecked(idx == 0)
         self.btn_set.setChecked(idx == 1)
         self.btn_key.setChecked(False)
 
+    def _update_preview_active(self, _=None):
+        visible = (
+            self.main_stack.currentIndex() == 0 and
+            self.content_stack.currentIndex() == 0 and
+            not self.isMinimized()
+        )
+        self.preview.set_active(visible)
+
+    def changeEvent(self, e):
+        if e.type() == QEvent.WindowStateChange:
+            self._update_preview_active()
+        super().changeEvent(e)
+
+    def _detach_keyboard_gaze(self):
+        self.full_keyboard.attach_gaze(None)
+        if self.engine is not None: self.engine.update(os_cursor=True)
+
     def _create_camera_page(self):
         w = QWidget()
         lay = QVBoxLayout(w)
@@ -666,11 +715,16 @@ class EyeMouseAppV4(QWidget):
         self.lbl_feed.setAlignment(Qt.AlignCenter)
         self.lbl_feed.setStyleSheet("background: #000; border: 2px solid #333; border-radius: 12px; color: #555;")
         self.lbl_feed.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+        # Live latency / FPS summary from the tracker
+        self.lbl_metrics = QLabel("")
+        self.lbl_metrics.setObjectName("Metrics")
         
         lay.addWidget(head)
         lay.addLayout(h)
         lay.addSpacing(20)
         lay.addWidget(self.lbl_feed)
+        lay.addWidget(self.lbl_metrics)
         return w
 
     def _create_settings_page(self):
@@ -692,6 +746,12 @@ class EyeMouseAppV4(QWidget):
         lay.addSpacing(20)
         self._add_sl(lay, "Sensitivity (x0.1)", 5, 50, 16, "sensitivity")
         self._add_sl(lay, "Deadzone (px)", 0, 20, 4, "deadzone")
+
+        lay.addSpacing(20)
+        # Keyboard reads gaze directly from the tracker; optionally leave the OS cursor alone there
+        self.chk_freeze = QCheckBox("Klavyede imleci hareket ettirme")
+        self.chk_freeze.setChecked(True)
+        lay.addWidget(self.chk_freeze)
         return w
 
     def _add_sl(self, lay, txt, minv, maxv, val, key):
@@ -700,21 +760,15 @@ class EyeMouseAppV4(QWidget):
         s.setRange(minv, maxv)
         s.setValue(val)
         s.valueChanged.connect(lambda v: l.setText(f"{txt}: {v/100:.2f}"))
+        s.valueChanged.connect(self._push_params)
         lay.addWidget(l)
         lay.addWidget(s)
         lay.addSpacing(15)
         self.sliders[key] = s
 
     # LOGIC
-    def start_engine(self):
-        if self.running: return
-        self.running = True
-        self.btn_start.setEnabled(False)
-        self.btn_stop.setEnabled(True)
-        self.lbl_feed.setText("Başlatılıyor...")
-        
-        # Params
-        p = {
+    def _slider_params(self):
+        return {
             'smoothing': self.sliders['smoothing'].value()/100,
             'ear_click_th': self.sliders['ear'].value()/100,
             'click_cooldown': self.sliders['cooldown'].value()/100,
@@ -722,40 +776,65 @@ class EyeMouseAppV4(QWidget):
             'sens_gain': self.sliders['sensitivity'].value()/10,
             'deadzone_px': self.sliders['deadzone'].value()
         }
-        
-        def loop():
-            try:
-                eye_mouse.main(
-                    **p,
-                    enable_right_click=True,
-                    show_preview=False,
-                    frame_callback=self.frame_signal.emit
-                )
-            except Exception as e:
-                print(e)
-            finally:
-                self.stop_visuals()
-        
-        self.thread = threading.Thread(target=loop, daemon=True)
-        self.thread.start()
+
+    def _push_params(self, _=None):
+        # Live tuning: the running tracker picks the new values up on its next frame
+        if self.engine is not None:
+            self.engine.update(**self._slider_params())
+
+    def start_engine(self):
+        if self.running: return
+        self.running = True
+        self.btn_start.setEnabled(False)
+        self.btn_stop.setEnabled(True)
+        self.lbl_feed.setText("Başlatılıyor...")
+        self.preview.set_target(self.lbl_feed.contentsRect().width(), self.lbl_feed.contentsRect().height())
+        
+        # First start opens camera/model/FaceMesh inside the engine thread; later starts are instant
+        if self.engine is None:
+            self.engine = eye_mouse.EyeMouseEngine()
+        self.engine.update(**self._slider_params(), enable_right_click=True)
+        self.engine.start(
+            preview=self.preview,
+            gaze=self.gaze_channel,
+            metrics_callback=self.metrics_signal.emit,
+            stopped_callback=self.stopped_signal.emit
+        )
 
     def stop_engine(self):
-        if self.running: eye_mouse.stop()
+        if self.running: self.engine.stop()
+
+    def closeEvent(self, e):
+        if self.engine is not None: self.engine.close()
+        self.full_keyboard.save_ngram()
+        super().closeEvent(e)
 
     def stop_visuals(self):
+        # Late signal from a previous session: ignore it if a new one has started meanwhile
+        if self.engine is not None and self.engine.active:
+            return
         self.running = False
+        self._detach_keyboard_gaze()
         self.btn_start.setEnabled(True)
         self.btn_stop.setEnabled(False)
         self.lbl_feed.setText("Kamera Kapalı")
+        self.lbl_metrics.setText("")
 
-    @pyqtSlot(np.ndarray)
-    def update_feed(self, frame):
+    @pyqtSlot(dict)
+    def update_metrics(self, snap):
         if not self.running: return
+        self.lbl_metrics.setText(format_metrics(snap))
+
+    @pyqtSlot()
+    def update_feed(self):
+        frame = self.preview.take()   # already RGB and at display size
+        if frame is None or not self.running: return
         h, w, ch = frame.shape
-        qt = QImage(frame.data, w, h, ch*w, QImage.Format_RGB888)
-        self.lbl_feed.setPixmap(QPixmap.fromImage(qt).scaled(
-            self.lbl_feed.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
-        ))
+        qt = QImage(frame.data, w, h, frame.strides[0], QImage.Format_RGB888)
+        self.lbl_feed.setPixmap(QPixmap.fromImage(qt))
+        # Next frame follows the label if the window was resized
+        r = self.lbl_feed.contentsRect()
+        self.preview.set_target(r.width(), r.height())
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -0,0 +1,100 @@
+# src/landmarks.py
+from itertools import chain
+import numpy as np
+
+# --- FaceMesh landmark indeksleri (refine_landmarks=True → 478 nokta) ---
+LEFT_EYE   = [33,160,158,133,153,144]
+RIGHT_EYE  = [263,387,385,362,380,373]
+LEFT_IRIS  = [468,469,470,471,472]
+RIGHT_IRIS = [473,474,475,476,477]
+
+N_LANDMARKS = 478
+
+# Tek fancy-index ile alınan birleşik alt kümeler
+EYES_IDX      = np.array(LEFT_EYE + RIGHT_EYE)                            # (12,) sol 6 + sağ 6
+EYES_IRIS_IDX = np.array(LEFT_EYE + RIGHT_EYE + LEFT_IRIS + RIGHT_IRIS)   # (22,)
+IRIS_IDX      = np.array(LEFT_IRIS + RIGHT_IRIS)                          # (10,) sol 5 + sağ 5
+
+
+def landmarks_to_array(lmk, w, h, out=None):
+    """
+    MediaPipe landmark listesini kare başına BİR kez (N,3) piksel dizisine çevirir.
+    x,y → piksel; z → x ile aynı ölçek (MediaPipe tanımı).
+    out verilirse (N,3) float32 tampon yeniden kullanılır.
+    """
+    n = len(lmk)
+    flat = np.fromiter(chain.from_iterable((p.x, p.y, p.z) for p in lmk), dtype=np.float32, count=3 * n)
+    if out is None:
+        pts = flat.reshape(n, 3)
+    else:
+        pts = out[:n]
+        pts[:] = flat.reshape(n, 3)
+    pts *= (w, h, w)
+    return pts
+
+
+def eye_points(pts):
+    """(N,3) diziden iki gözün 2B noktaları: (2,6,2) → [0]=sol, [1]=sağ."""
+    return pts[EYES_IDX, :2].reshape(2, 6, 2)
+
+
+def iris_points(pts):
+    """(N,3) diziden iki irisin 2B noktaları: (2,5,2) → [0]=sol, [1]=sağ (ilk nokta merkez)."""
+    return pts[IRIS_IDX, :2].reshape(2, 5, 2)
+
+
+def ear(pts: np.ndarray):
+    """
+    Eye Aspect Ratio (EAR).
+    (6,2) → tek değer, (2,6,2) → iki gözün değeri birlikte.
+    """
+    A = np.linalg.norm(pts[..., 1, :] - pts[..., 5, :], axis=-1)
+    B = np.linalg.norm(pts[..., 2, :] - pts[..., 4, :], axis=-1)
+    C = np.linalg.norm(pts[..., 0, :] - pts[..., 3, :], axis=-1) + 1e-6
+    return (A + B) / (2.0 * C)
+
+
+# --- Kalibrasyon özellikleri ---
+# Kayıt (calibration_capture) ve çalışma zamanı (eye_mouse_calibrated) aynı sırayı kullanır;
+# model dosyası hangi sütunları kullandığını adlarıyla saklar.
+#   eye_*, left_*, right_*  → göz kapağı noktalarının ortalaması (piksel; çoğunlukla baş konumu)
+#   *iris_*                 → iris merkezinin kendi gözünün köşe-köşe çerçevesindeki konumu
+#                             (göz genişliği = 1, göz ortası = 0; göz dönüşü)
+#   POSE_FEATURES           → baş pozu (derece, mm); head_pose.HeadPose doldurur
+POSE_FEATURES = ("yaw", "pitch", "roll", "head_x", "head_y", "head_z")
+FEATURES = (
+    "eye_x", "eye_y", "left_x", "left_y", "right_x", "right_y",
+    "iris_x", "iris_y", "left_iris_x", "left_iris_y", "right_iris_x", "right_iris_y",
+) + POSE_FEATURES
+POSE_SLICE = slice(len(FEATURES) - len(POSE_FEATURES), len(FEATURES))
+
+_CORNERS = [0, 3]   # LEFT_EYE / RIGHT_EYE içinde iki köşe
+
+
+def gaze_features(eyes, iris, out=None):
+    """
+    (2,6,2) göz + (2,5,2) iris noktaları → FEATURES vektörünün göz/iris kısmı
+    (out yeniden kullanılır; POSE_SLICE alanlarına dokunulmaz).
+
+    İris çerçevesi: köşeden köşeye eksen u (+x yönüne çevrilir), ona dik v. İris merkezi
+    göz ortasına göre bu eksenlere izdüşürülüp göz genişliğine bölünür → kameraya uzaklık
+    ve baş yuvarlanmasından (roll) büyük ölçüde bağımsız.
+    """
+    if out is None:
+        out = np.zeros(len(FEATURES))
+    lr = out[2:6].reshape(2, 2)
+    np.mean(eyes, axis=1, out=lr)               # sol/sağ göz merkezi
+    np.add(lr[0], lr[1], out=out[0:2])
+    out[0:2] *= 0.5                             # iki gözün ortası (= 12 noktanın ortalaması)
+
+    c = eyes[:, _CORNERS]                       # (2,2,2) köşeler
+    u = c[:, 1] - c[:, 0]                       # (2,2) köşe ekseni
+    u *= np.where(u[:, :1] < 0, -1.0, 1.0)      # iki gözde de +x yönünde
+    d = iris.mean(axis=1) - c.mean(axis=1)      # iris merkezi − göz ortası
+    w2 = np.einsum("ij,ij->i", u, u) + 1e-9     # göz genişliği²
+    rel = out[8:12].reshape(2, 2)
+    rel[:, 0] = np.einsum("ij,ij->i", d, u) / w2                     # köşe ekseni boyunca
+    rel[:, 1] = (u[:, 0] * d[:, 1] - u[:, 1] * d[:, 0]) / w2         # dik (aşağı +)
+    np.add(rel[0], rel[1], out=out[6:8])
+    out[6:8] *= 0.5
+    return out
@@ -0,0 +1,64 @@
+# src/lexicon_build.py
+"""
+Kelime/sıklık listesini klavyenin mmap ile açtığı ikili sözlüğe derler.
+
+Kullanım:
+  python lexicon_build.py                                  # ../data/lexicon/tr_words.tsv → .bin
+  python lexicon_build.py kelimeler.tsv cikti.bin
+Girdi: satır başına "kelime<TAB>sıklık" (UTF-8). Düzen için word_predictor.py'ye bakın.
+"""
+import os, sys
+import numpy as np
+
+from word_predictor import (
+    LEXICON_PATH, LEXICON_MAGIC, LEXICON_VERSION, HEADER,
+    read_lexicon, dedupe_entries,
+)
+
+
+def build(entries, out_path):
+    """[(kelime, sıklık), ...] → ikili sözlük. Yazılan kelime sayısını döndürür."""
+    rows = dedupe_entries(entries)
+    keys = [r[0].encode("utf-8") for r in rows]
+    words = [r[1].encode("utf-8") for r in rows]
+    n = len(rows)
+
+    key_off = np.zeros(n + 1, dtype="<u4")
+    word_off = np.zeros(n + 1, dtype="<u4")
+    np.cumsum([len(k) for k in keys], out=key_off[1:])
+    np.cumsum([len(w) for w in words], out=word_off[1:])
+    freqs = np.array([r[2] for r in rows], dtype="<f4")
+
+    header = np.zeros(1, dtype=HEADER)
+    header["magic"] = LEXICON_MAGIC
+    header["version"] = LEXICON_VERSION
+    header["n"] = n
+    header["keys_len"] = key_off[-1]
+    header["words_len"] = word_off[-1]
+
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    tmp = out_path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(header.tobytes())
+        f.write(key_off.tobytes())
+        f.write(word_off.tobytes())
+        f.write(freqs.tobytes())
+        f.write(b"".join(keys))
+        f.write(b"".join(words))
+    os.replace(tmp, out_path)   # açık olan eski dosya bozulmaz
+    return n
+
+
+def main():
+    src = sys.argv[1] if len(sys.argv) > 1 else LEXICON_PATH
+    dst = sys.argv[2] if len(sys.argv) > 2 else os.path.splitext(src)[0] + ".bin"
+    if not os.path.isfile(src):
+        print(f"❌ Sözlük bulunamadı: {src}")
+        return 1
+    n = build(read_lexicon(src), dst)
+    print(f"✅ {n} kelime → {dst} ({os.path.getsize(dst) / 1e6:.1f} MB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+# src/metrics.py
+import json, time
+import numpy as np
+
+# Takip döngüsünün aşamaları (eye_mouse_calibrated içindeki sırayla)
+STAGES = ("capture", "convert", "facemesh", "ear", "predict", "smooth", "mouse", "preview")
+
+
+class PipelineMetrics:
+    """
+    Aşama bazlı gecikme ölçümü:
+      • Her karede begin_frame() → mark("aşama") ... → end_frame()
+      • Son `window` karenin süreleri halka tamponda (ms) tutulur
+      • snapshot(): p50/p95/p99, FPS, atlanan kare sayısı ve döngü süresi (ilk karenin
+        başından son karenin sonuna; açılış/kapanış hariç)
+    Kare içinde çalışmayan aşamalar (ör. yüz yokken predict) NaN yazılır, yüzdelikleri bozmaz.
+    """
+
+    def __init__(self, stages=STAGES, window=300):
+        self.stages = tuple(stages)
+        self._index = {s: i for i, s in enumerate(self.stages)}
+        self.window = window
+        self._ms = np.full((window, len(self.stages)), np.nan)
+        self._total = np.full(window, np.nan)
+        self._ends = np.zeros(window)           # kare bitiş zamanları (FPS için)
+        self._cur = np.zeros(len(self.stages))
+        self._hit = np.zeros(len(self.stages), dtype=bool)
+        self._t0 = self._t = 0.0
+        self._start = 0.0                       # ilk karenin begin_frame zamanı
+        self.frames = 0
+        self.dropped = 0
+
+    # ----------------- Döngü içi -----------------
+    def begin_frame(self):
+        self._cur[:] = 0.0
+        self._hit[:] = False
+        self._t0 = self._t = time.perf_counter()
+
+    def mark(self, stage):
+        """Bir önceki işaretten bu yana geçen süreyi `stage` aşamasına ekler."""
+        now = time.perf_counter()
+        i = self._index[stage]
+        self._cur[i] += now - self._t
+        self._hit[i] = True
+        self._t = now
+
+    def end_frame(self, dropped=None):
+        row = self.frames % self.window
+        self._ms[row] = np.where(self._hit, self._cur * 1000.0, np.nan)
+        self._total[row] = (self._t - self._t0) * 1000.0
+        self._ends[row] = self._t
+        if self.frames == 0:
+            self._start = self._t0
+        self.frames += 1
+        if dropped is not None:
+            self.dropped = dropped
+
+    # ----------------- Okuma -----------------
+    def fps(self):
+        n = min(self.frames, self.window)
+        if n < 2:
+            return 0.0
+        last = (self.frames - 1) % self.window
+        first = (self.frames - n) % self.window
+        span = self._ends[last] - self._ends[first]
+        return (n - 1) / span if span > 0 else 0.0
+
+    def snapshot(self):
+        n = min(self.frames, self.window)
+        snap = {
+            "time": time.time(),
+            "frames": self.frames,
+            "dropped": self.dropped,
+            "fps": round(float(self.fps()), 2),
+            "stages": {},
+        }
+        if n == 0:
+            return snap
+        snap["loop_s"] = round(float(self._t - self._start), 3)
+        ms = self._ms[:n]
+        for i, s in enumerate(self.stages):
+            col = ms[:, i]
+            if np.isnan(col).all():
+                continue
+            p50, p95, p99 = np.nanpercentile(col, (50, 95, 99))
+            snap["stages"][s] = _pcts(p50, p95, p99)
+        snap["total"] = _pcts(*np.percentile(self._total[:n], (50, 95, 99)))
+        return snap
+
+    def dump(self, path, snap=None):
+        """Anlık görüntüyü JSON Lines olarak dosyaya ekler."""
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(snap or self.snapshot()) + "\n")
+
+
+def _pcts(p50, p95, p99):
+    return {"p50": round(float(p50), 3), "p95": round(float(p95), 3), "p99": round(float(p99), 3)}
+
+
+def format_metrics(snap):
+    """GUI'de tek satır gösterim için kısa metin."""
+    parts = [f"FPS {snap['fps']:.1f}", f"atlanan {snap['dropped']}"]
+    total = snap.get("total")
+    if total:
+        parts.append(f"toplam p50 {total['p50']:.1f} / p95 {total['p95']:.1f} ms")
+    stages = snap.get("stages", {})
+    if stages:
+        worst = max(stages, key=lambda s: stages[s]["p95"])
+        parts.append(f"en yavaş: {worst} p95 {stages[worst]['p95']:.1f} ms")
+    return "  |  ".join(parts)
@@ -0,0 +1,127 @@
+# src/mouse_actuator.py
+import threading, time
+from collections import deque
+
+# Sink arayüzü: move(x, y), click(button)  — button: "left" | "right"
+
+
+class PynputSink:
+    """
+    Gerçek imleç (pynput).
+    pynput burada yüklenir → ekransız (headless) makinede modüller yine import edilebilir.
+    """
+
+    def __init__(self):
+        from pynput.mouse import Controller, Button
+        self._mouse = Controller()
+        self._buttons = {"left": Button.left, "right": Button.right}
+
+    def move(self, x, y):
+        self._mouse.position = (x, y)
+
+    def click(self, button):
+        self._mouse.click(self._buttons[button], 1)
+
+
+class NullSink:
+    """Hiçbir şey yapmaz (benchmark/test)."""
+
+    def move(self, x, y):
+        pass
+
+    def click(self, button):
+        pass
+
+
+class RecordingSink:
+    """Hareket ve tıklamaları zaman damgasıyla kaydeder (benchmark/test)."""
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.moves = []     # [t, x, y]
+        self.clicks = []    # [t, button]
+
+    def move(self, x, y):
+        self.moves.append([round(self.clock(), 4), int(x), int(y)])
+
+    def click(self, button):
+        self.clicks.append([round(self.clock(), 4), button])
+
+
+class MouseActuator:
+    """
+    Mouse çıkışını görüntü döngüsünden ayırır:
+      • move() sadece hedefi günceller; bekleyen hareketler birleşir, en son hedef gönderilir
+      • İşletim sistemine giden hareket sayısı max_rate_hz ile sınırlanır
+      • click() kesin sıralıdır: kendisinden önce istenen hareket önce gönderilir
+    move()/click() hiç bloklamaz; sink'teki (pynput/OS) takılmalar kare hızını etkilemez.
+    """
+
+    def __init__(self, sink, max_rate_hz=125.0):
+        self.sink = sink
+        self.interval = 1.0 / max_rate_hz if max_rate_hz else 0.0
+        self._cond = threading.Condition()
+        self._pending = None          # birleşen son hareket hedefi
+        self._events = deque()        # sıralı olaylar: ("move", (x,y)) / ("click", button)
+        self._next_move = 0.0
+        self._closed = False
+
+        self.moves_requested = 0
+        self.moves_sent = 0
+        self.clicks_sent = 0
+
+        self._thread = threading.Thread(target=self._run, name="MouseActuator", daemon=True)
+        self._thread.start()
+
+    @property
+    def moves_coalesced(self):
+        return self.moves_requested - self.moves_sent - (self._pending is not None)
+
+    # ----------------- Görüntü döngüsü tarafı -----------------
+    def move(self, x, y):
+        with self._cond:
+            self._pending = (x, y)
+            self.moves_requested += 1
+            self._cond.notify()
+
+    def click(self, button):
+        with self._cond:
+            # Tıklama, o ana kadar istenen son konumda olmalı
+            if self._pending is not None:
+                self._events.append(("move", self._pending))
+                self._pending = None
+            self._events.append(("click", button))
+            self._cond.notify()
+
+    def close(self, timeout=1.0):
+        """Bekleyen olayları gönderip thread'i durdurur."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join(timeout)
+
+    # ----------------- Çıkış thread'i -----------------
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._events and self._pending is None and not self._closed:
+                    self._cond.wait()
+                if self._events:
+                    kind, arg = self._events.popleft()
+                elif self._pending is not None:
+                    wait = self._next_move - time.perf_counter()
+                    if wait > 0 and not self._closed:
+                        self._cond.wait(wait)
+                        continue
+                    kind, arg = "move", self._pending
+                    self._pending = None
+                else:
+                    return   # kapatıldı ve gönderilecek bir şey kalmadı
+
+            if kind == "move":
+                self.sink.move(*arg)
+                self.moves_sent += 1
+                self._next_move = time.perf_counter() + self.interval
+            else:
+                self.sink.click(arg)
+                self.clicks_sent += 1
@@ -0,0 +1,180 @@
+# src/ngram_model.py
+import heapq, json, os, re
+
+from word_predictor import tr_upper
+
+# Klavye için sonraki kelime tahmini (unigram/bigram/trigram, "stupid backoff").
+# Tohum: hazır cümleler (+ varsa derlem dosyası); sonra kullanıcının yazdıklarıyla
+# artımlı güncellenir. Girdi sayısı (kelime + bigram + trigram) sınırlıdır: sınır aşılınca
+# en seyrek girdiler atılır. Durum JSON olarak saklanır ve oturumlar arasında korunur.
+#
+# Tahmin kelime sayısından bağımsızdır: unigram toplamı ve en sık UNI_TOP kelime learn()
+# sırasında güncel tutulur; tahminde sadece bağlam tabloları ve bu kısa liste puanlanır.
+
+NGRAM_PATH = "../data/lexicon/ngram_user.json"
+CORPUS_PATH = "../data/lexicon/tr_corpus.txt"   # opsiyonel: satır başına bir cümle
+
+_WORD_RE = re.compile(r"[^\W\d_]+", re.UNICODE)
+
+BACKOFF = 0.4   # alt dereceye düşerken puan çarpanı
+UNI_TOP = 50    # tahminde kullanılan en sık kelime sayısı (k bundan büyük olamaz)
+
+
+def tokenize(text):
+    return _WORD_RE.findall(text)
+
+
+class NgramModel:
+    """
+    learn(words, new=1)  → words'ün son `new` kelimesini (önceki bağlamla) öğrenir
+    predict(context, k)  → bağlamdan (son 2 kelime) sonra en olası k kelime
+    Anahtarlar Türkçe büyük harfe çevrilir; önerilerde kelimenin son yazılan hâli gösterilir.
+    """
+
+    def __init__(self, max_entries=50000):
+        self.max_entries = max_entries
+        self.uni = {}       # K → sayı
+        self.bi = {}        # K1 → {K: sayı}
+        self.tri = {}       # "K1 K2" → {K: sayı}
+        self.display = {}   # K → gösterilecek yazım
+        self.size = 0       # kelime + bigram + trigram girdi sayısı
+        self.uni_total = 0  # unigram sayılarının toplamı
+        self.top = []       # en sık UNI_TOP kelime (sayı azalan)
+        self.dirty = False
+
+    # ----------------- Öğrenme -----------------
+    def _inc(self, table, ctx, key):
+        d = table.get(ctx)
+        if d is None:
+            d = table[ctx] = {}
+        if key not in d:
+            self.size += 1
+        d[key] = d.get(key, 0) + 1
+
+    def _bump_top(self, key):
+        """key'in sayısı arttı → en sık kelimeler listesini günceller (O(UNI_TOP))."""
+        top, uni = self.top, self.uni
+        if key not in top:
+            if len(top) < UNI_TOP:
+                top.append(key)
+            elif uni[key] > uni[top[-1]]:
+                top[-1] = key
+            else:
+                return
+        top.sort(key=uni.__getitem__, reverse=True)
+
+    def _rebuild_top(self):
+        self.top = heapq.nlargest(UNI_TOP, self.uni, key=self.uni.__getitem__)
+
+    def learn(self, words, new=1):
+        keys = [tr_upper(w) for w in words]
+        for i in range(max(len(keys) - new, 0), len(keys)):
+            k = keys[i]
+            self.display[k] = words[i]
+            if k not in self.uni:
+                self.size += 1
+            self.uni[k] = self.uni.get(k, 0) + 1
+            self.uni_total += 1
+            self._bump_top(k)
+            if i >= 1:
+                self._inc(self.bi, keys[i - 1], k)
+            if i >= 2:
+                self._inc(self.tri, keys[i - 2] + " " + keys[i - 1], k)
+        self.dirty = True
+        if self.size > self.max_entries:
+            self.prune()
+
+    def learn_text(self, text):
+        for line in text.splitlines():
+            words = tokenize(line)
+            if words:
+                self.learn(words, new=len(words))
+
+    def prune(self, keep=0.8):
+        """
+        En seyrek girdileri (önce trigram, sonra bigram, sonra kelime) sınırın keep katına
+        inene kadar atar; sayı eşiği her turda bir artar.
+        """
+        target = int(self.max_entries * keep)
+        cutoff = 1
+        while self.size > target:
+            for table in (self.tri, self.bi):
+                for ctx in list(table):
+                    d = table[ctx]
+                    for k in [k for k, c in d.items() if c <= cutoff]:
+                        del d[k]
+                        self.size -= 1
+                    if not d:
+                        del table[ctx]
+                if self.size <= target:
+                    break
+            else:
+                for k in [k for k, c in self.uni.items() if c <= cutoff]:
+                    self.uni_total -= self.uni.pop(k)
+                    self.display.pop(k, None)
+                    self.size -= 1
+            cutoff += 1
+        self._rebuild_top()
+
+    # ----------------- Tahmin -----------------
+    def predict(self, context, k=10):
+        keys = [tr_upper(w) for w in context[-2:]]
+        scores = {}
+        weight = 1.0
+        if len(keys) == 2:
+            self._score(scores, self.tri.get(keys[0] + " " + keys[1]), weight)
+            weight *= BACKOFF
+        if keys:
+            self._score(scores, self.bi.get(keys[-1]), weight)
+            weight *= BACKOFF
+        if len(scores) < k and self.uni_total:
+            for key in self.top:
+                s = weight * self.uni[key] / self.uni_total
+                if s > scores.get(key, 0.0):
+                    scores[key] = s
+        best = heapq.nlargest(k, scores.items(), key=lambda kv: kv[1])
+        return [self.display.get(key, key) for key, _ in best]
+
+    @staticmethod
+    def _score(scores, counts, weight):
+        if not counts:
+            return
+        total = sum(counts.values())
+        for key, c in counts.items():
+            s = weight * c / total
+            if s > scores.get(key, 0.0):
+                scores[key] = s
+
+    # ----------------- Kalıcılık -----------------
+    def save(self, path=NGRAM_PATH):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({
+                "version": 1, "max_entries": self.max_entries,
+                "uni": self.uni, "bi": self.bi, "tri": self.tri, "display": self.display,
+            }, f, ensure_ascii=False)
+        os.replace(tmp, path)
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path=NGRAM_PATH, seed=(), corpus_path=CORPUS_PATH):
+        """Kayıtlı durumu yükler; yoksa tohum cümlelerden (ve varsa derlemden) yeni model kurar."""
+        if os.path.isfile(path):
+            with open(path, encoding="utf-8") as f:
+                d = json.load(f)
+            m = cls(d.get("max_entries", 50000))
+            m.uni, m.bi, m.tri, m.display = d["uni"], d["bi"], d["tri"], d["display"]
+            m.size = len(m.uni) + sum(len(v) for v in m.bi.values()) + sum(len(v) for v in m.tri.values())
+            m.uni_total = sum(m.uni.values())
+            m._rebuild_top()
+            if m.size > m.max_entries:      # eski sürüm dosyası: kelimeler sınıra dahil değildi
+                m.prune()
+            return m
+        m = cls()
+        m.learn_text("\n".join(seed))
+        if corpus_path and os.path.isfile(corpus_path):
+            with open(corpus_path, encoding="utf-8") as f:
+                for line in f:
+                    m.learn_text(line)
+        return m
@@ -0,0 +1,68 @@
+# src/online_recalibration.py
+import numpy as np
+
+# Kullanım sırasında çevrimiçi kalibrasyon düzeltmesi (unutma çarpanlı RLS).
+# Arayüzün kesin bildiği her hedef (ör. dwell ile seçilen tuşun merkezi) bir (bakış özelliği,
+# hedef konumu) örneği olarak alınır; CalibrationMapper katsayıları özyinelemeli en küçük
+# karelerle yerinde güncellenir. Hedef imlecin kendi konumundan alınmaz: model kendi
+# çıktısını öğrenip hatasını pekiştirirdi. Güncelleme geçmişten bağımsızdır: O(m²) işlem,
+# (m,m) kovaryans (m = model terim sayısı, ör. poly2 → 6). Unutma çarpanı eski hedeflerin
+# etkisini azaltır → baş konumu değiştikçe oluşan kayma sürekli düzeltilir.
+#
+# Kovaryansın başlangıç izi üst sınırdır: aynı hedef tekrar tekrar onaylanıp model
+# başka yönlerde "uyarılmadığında" P şişip katsayılar kararsızlaşmaz (windup).
+
+
+class OnlineRecalibrator:
+    """
+    update(x, target, weight) → x: model girişleri (d,), target: (tx, ty) piksel.
+    Dönüş: güncelleme öncesi hata (px) veya örnek reddedildiyse None.
+    reset()                   → dosyadan yüklenen katsayılara döner.
+
+    forget : unutma çarpanı (1 → hiç unutma; 0.95 → ~20 hedeflik bellek)
+    p0     : başlangıç kovaryansı (normalize özellik uzayında); ilk hedefte hatanın
+             kabaca p0·m / (1 + p0·m) kadarı düzeltilir
+    max_px : tahmin ile hedef arasındaki fark bundan büyükse örnek reddedilir
+             (kullanıcı hedefe bakmıyordu)
+    """
+
+    def __init__(self, mapper, forget=0.95, p0=0.1, max_px=200.0):
+        self.mapper = mapper
+        self.forget = forget
+        self.max_px = max_px
+        self.base = mapper.coef.copy()
+        m = len(mapper.terms)
+        self.p0 = p0
+        self.P = np.eye(m) * p0
+        self.max_trace = p0 * m
+        self.updates = 0
+        self.rejected = 0
+        self._err = np.empty(2)
+        self._Pphi = np.empty(m)
+
+    def reset(self):
+        self.mapper.coef[:] = self.base
+        self.P[:] = np.eye(len(self.P)) * self.p0
+        self.updates = self.rejected = 0
+
+    def update(self, x, target, weight=1.0):
+        mapper = self.mapper
+        phi = mapper.phi(x)
+        np.subtract(target, phi @ mapper.coef, out=self._err)
+        err_px = float(np.hypot(*self._err))
+        if err_px > self.max_px or weight <= 0:
+            self.rejected += 1
+            return None
+
+        # k = P φ / (λ/w + φᵀ P φ);  θ += k eᵀ;  P = (P − k φᵀ P) / λ
+        lam = self.forget
+        Pphi = np.dot(self.P, phi, out=self._Pphi)
+        k = Pphi / (lam / weight + phi @ Pphi)
+        mapper.coef += np.outer(k, self._err)
+        self.P -= np.outer(k, Pphi)
+        if np.trace(self.P) < self.max_trace * lam:
+            self.P /= lam
+        self.P += self.P.T          # sayısal simetri
+        self.P *= 0.5
+        self.updates += 1
+        return err_px
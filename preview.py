@@ -0,0 +1,109 @@
+# src/preview.py
+import time
+import cv2, numpy as np
+
+# İşçi thread'i (takip döngüsü) → GUI önizleme yolu.
+# Kare, etiketin gösterim boyutunda ve RGB olarak işçi thread'inde hazırlanır;
+# GUI'ye sadece "yeni kare hazır" bildirimi gider, dizi sinyalle taşınmaz.
+# Önizlemenin kendi hız sınırı vardır (takip hızından bağımsız); önizleme görünmüyorken
+# (başka sayfa / küçültülmüş pencere) hiç kare hazırlanmaz, çizim de yapılmaz.
+
+PREVIEW_FPS = 15.0
+
+
+class PreviewBuffer:
+    """
+    Çift tamponlu, kilitsiz önizleme kanalı (tek yazan, tek okuyan).
+
+      İşçi:  publish(frame_bgr) → arka tampona küçültür + RGB'ye çevirir, tamponları
+             değiştirir, notify() çağırır. GUI önceki kareyi henüz almadıysa kare atlanır.
+      GUI:   take() → ön tampon (RGB, gösterim boyutunda); aynı slot içinde kullanılmalı
+             (QPixmap.fromImage kopyalar). set_target(w, h) → etiket boyutu.
+
+    GUI take() ile bir kareyi alana kadar işçi yeni kare yazmaz; aldıktan sonra işçi
+    diğer tampona yazar. Böylece GUI'nin okuduğu tampon hiçbir zaman üzerine yazılmaz.
+    """
+
+    def __init__(self, notify=None, width=640, height=480, max_fps=PREVIEW_FPS):
+        self.notify = notify            # "kare hazır" bildirimi (ör. pyqtSignal.emit)
+        self.target = (width, height)   # GUI'nin gösterim alanı
+        self.active = True              # önizleme ekranda görünüyor mu?
+        self.set_fps(max_fps)
+        self._next_t = 0.0
+        self._bufs = None
+        self._front = 0
+        self._ready = False             # GUI'nin henüz almadığı kare var mı?
+        self.frames_published = 0
+        self.frames_skipped = 0
+
+    # ----------------- GUI tarafı -----------------
+    def set_target(self, width, height):
+        """Gösterim alanı boyutu; bir sonraki kareden itibaren geçerli."""
+        self.target = (max(int(width), 1), max(int(height), 1))
+
+    def set_fps(self, max_fps):
+        """Önizleme hız sınırı (kare/s); 0/None → sınırsız."""
+        self.period = 1.0 / max_fps if max_fps else 0.0
+
+    def set_active(self, active):
+        """Önizleme görünmüyorsa False: işçi kare hazırlamayı tamamen bırakır."""
+        self.active = bool(active)
+        if not self.active:
+            self._ready = False   # bekleyen eski kare gösterilmesin
+
+    def take(self):
+        """Son hazır kare (RGB) veya None."""
+        if not self._ready:
+            return None
+        buf = self._bufs[self._front]
+        self._ready = False
+        return buf
+
+    def clear(self):
+        self._ready = False
+
+    # ----------------- İşçi tarafı -----------------
+    def wants_frame(self):
+        """
+        Bu kare önizlemeye hazırlansın mı? Hayırsa çizim de yapılmamalı.
+          • önizleme görünmüyor            → hayır
+          • önizleme hız sınırı dolmadı     → hayır
+          • GUI son kareyi henüz almadı     → hayır (atlanan kare sayılır)
+        """
+        if not self.active:
+            return False
+        now = time.perf_counter()
+        if now < self._next_t:
+            return False
+        if self._ready:
+            self.frames_skipped += 1
+            return False
+        # geride kaldıysak biriktirme, saati yeniden hizala
+        self._next_t = max(self._next_t, now - self.period) + self.period
+        return True
+
+    def _fit(self, fw, fh):
+        tw, th = self.target
+        s = min(tw / fw, th / fh)
+        return max(int(fw * s), 1), max(int(fh * s), 1)
+
+    def publish(self, frame):
+        """BGR kareyi gösterim boyutunda ön tampona koyar; atlandıysa False."""
+        if self._ready:
+            self.frames_skipped += 1
+            return False
+        w, h = self._fit(frame.shape[1], frame.shape[0])
+        if self._bufs is None or self._bufs[0].shape[:2] != (h, w):
+            self._bufs = [np.empty((h, w, 3), dtype=np.uint8) for _ in range(2)]
+            self._front = 0
+        back = self._front ^ 1
+        dst = self._bufs[back]
+        interp = cv2.INTER_AREA if w < frame.shape[1] else cv2.INTER_LINEAR
+        cv2.resize(frame, (w, h), dst=dst, interpolation=interp)
+        cv2.cvtColor(dst, cv2.COLOR_BGR2RGB, dst=dst)
+        self._front = back              # önce tampon, sonra bayrak
+        self._ready = True
+        self.frames_published += 1
+        if self.notify is not None:
+            self.notify()
+        return True
@@ -0,0 +1,73 @@
+# src/roi_tracker.py
+import cv2
+
+
+class RoiTracker:
+    """
+    FaceMesh'i tam kare yerine yüz bölgesinde çalıştırır:
+      • Önceki karedeki landmark'lardan dolgu eklenmiş bir yüz kutusu çıkarılır
+      • Kırpma, küçültme, ayna (flip) ve BGR→RGB sadece bu kutu üzerinde yapılır
+      • Yüz kaybolursa bir sonraki karede tam kare arama yapılır
+
+    Koordinatlar: box ham (aynalanmamış) karede tutulur; to_frame() landmark'ları
+    aynalanmış tam kare piksellerine çevirir (önizlemede çizilen kare ile aynı).
+    """
+
+    def __init__(self, pad=0.35, max_side=256, min_side=96):
+        self.pad = pad                # kutuya eklenen dolgu (yüz boyutunun oranı)
+        self.max_side = max_side      # takipteyken kırpmanın uzun kenarı en fazla bu kadar
+        self.min_side = min_side
+        self.box = None               # (x0, y0, x1, y1) ham karede; None → tam kare arama
+        self.frame_w = self.frame_h = 0
+        self.crop_w = self.crop_h = 0
+        self._ox = self._oy = 0       # aynalanmış karede kırpma ofseti
+
+    @property
+    def tracking(self):
+        return self.box is not None
+
+    def prepare(self, frame):
+        """Ham BGR kareden FaceMesh'e verilecek aynalanmış RGB kırpmayı üretir."""
+        h, w = frame.shape[:2]
+        self.frame_w, self.frame_h = w, h
+        x0, y0, x1, y1 = self.box if self.box is not None else (0, 0, w, h)
+        crop = frame[y0:y1, x0:x1]
+        self.crop_w, self.crop_h = x1 - x0, y1 - y0
+        self._ox, self._oy = w - x1, y0
+
+        if self.box is not None:
+            s = self.max_side / max(self.crop_w, self.crop_h)
+            if s < 1.0:
+                size = (max(1, int(self.crop_w * s)), max(1, int(self.crop_h * s)))
+                crop = cv2.resize(crop, size, interpolation=cv2.INTER_AREA)
+
+        crop = cv2.flip(crop, 1)
+        return cv2.cvtColor(crop, cv2.COLOR_BGR2RGB)
+
+    def to_frame(self, pts):
+        """Kırpma pikselindeki (N,3) noktaları yerinde aynalanmış tam kare pikseline taşır."""
+        pts[:, 0] += self._ox
+        pts[:, 1] += self._oy
+        return pts
+
+    def update(self, pts):
+        """Bu karenin landmark'larından (aynalanmış tam kare) bir sonraki kutuyu hesaplar."""
+        w, h = self.frame_w, self.frame_h
+        mx0, my0 = pts[:, :2].min(axis=0)
+        mx1, my1 = pts[:, :2].max(axis=0)
+        side = max(mx1 - mx0, my1 - my0, self.min_side)
+        cx, cy = (mx0 + mx1) / 2, (my0 + my1) / 2
+        half = side * (0.5 + self.pad)
+
+        # aynalanmış x → ham x
+        x0 = int(max(0, w - (cx + half)))
+        x1 = int(min(w, w - (cx - half)))
+        y0 = int(max(0, cy - half))
+        y1 = int(min(h, cy + half))
+        if x1 - x0 < 2 or y1 - y0 < 2:
+            self.box = None
+        else:
+            self.box = (x0, y0, x1, y1)
+
+    def reset(self):
+        self.box = None
@@ -0,0 +1,50 @@
+# src/tracker_params.py
+from collections import namedtuple
+
+# EyeMouseEngine'in çalışırken değiştirilebilen takip ayarları. update() yeni bir anlık
+# görüntüyü tek referans atamasıyla koyar ve sürüm sayacını artırır; döngü sadece sayacı
+# karşılaştırır, değiştiyse görüntüyü bir sonraki karede alır (kilit yok, yarım güncelleme
+# görülmez). Motordan ayrı modül: filter_eval gibi araçlar cv2/mediapipe yüklemeden aynı
+# alanları kullanır.
+TrackerParams = namedtuple("TrackerParams", [
+    # hareket/klik
+    "smoothing", "ear_click_th", "click_cooldown",
+    "enable_right_click", "enable_double_click", "dbl_blink_window",
+    # stabilizasyon
+    "hold_on_blink", "hold_extra_ms", "deadzone_px", "max_step_px",
+    # hız/yaklaşma
+    "sens_gain", "far_dist", "alpha_far",
+    # yumuşatma stratejisi (gaze_filters)
+    "filter", "euro_min_cutoff", "euro_beta", "kalman_q", "kalman_r", "kalman_lead",
+    # çıkış
+    "os_cursor",
+    # çevrimiçi kalibrasyon düzeltmesi
+    "online_recal", "recal_forget", "recal_weight", "recal_max_px",
+])
+
+DEFAULT_PARAMS = TrackerParams(
+    smoothing=0.22,             # temel yumuşatma (yakında kullanılır)
+    ear_click_th=0.20,
+    click_cooldown=0.30,        # tıklamalar arası bekleme (s)
+    enable_right_click=True,    # sağ göz 2x → sağ tık
+    enable_double_click=False,  # iki göz 2x → çift tık (opsiyonel)
+    dbl_blink_window=0.60,      # iki kırpma arası max süre (s)
+    hold_on_blink=True,         # göz kapalıyken imleci tut
+    hold_extra_ms=0.12,         # açıldıktan sonra şu kadar s daha tut
+    deadzone_px=4,              # küçük titreşimleri yok say
+    max_step_px=35,             # bir karede max adım
+    sens_gain=1.6,              # 👈 Hız kazancı (dx,dy çarpanı)
+    far_dist=120,               # 👈 Uzak hedef eşiği (px)
+    alpha_far=0.35,             # 👈 Uzakta iken daha yüksek alpha (daha hızlı)
+    filter="legacy",            # "legacy" (yukarıdaki zincir) | "one_euro" | "kalman" | "none"
+    euro_min_cutoff=1.0,        # One Euro: durağan bakışta kesim frekansı (Hz)
+    euro_beta=0.01,             # One Euro: hız başına kesim artışı
+    kalman_q=2e5,               # Kalman: ivme gürültüsü (px²/s³)
+    kalman_r=300.0,             # Kalman: ölçüm gürültüsü (px²)
+    kalman_lead=0.0,            # Kalman: hız × lead kadar ileri öngörü (s)
+    os_cursor=True,             # False → imleç hareketi/tıklama işletim sistemine gitmez (sadece bakış kanalı)
+    online_recal=True,          # arayüzün bildirdiği hedeflerle (confirm_target) modeli düzelt (RLS)
+    recal_forget=0.95,          # unutma çarpanı (küçük → kaymaya hızlı uyum)
+    recal_weight=1.0,           # hedef örneğinin ağırlığı
+    recal_max_px=200,           # tahmin hedeften bu kadar uzaksa örnek yok sayılır
+)
@@ -1,30 +1,38 @@
-import pandas as pd
-from sklearn.linear_model import LinearRegression
-import joblib, os
+import os, time
 
-def main():
-    data_path = "../data/raw/calibration.csv"
-    model_path = "../data/models/calibration_model.pkl"
+from calibration_mapper import MODEL_NPZ_PATH
+from calibration_store import load_samples, CALIB_PATH
+from calibration_trainer import select_model
 
-    if not os.path.exists(data_path):
+def main(k=5):
+    data_path = CALIB_PATH
+
+    loaded = load_samples(data_path)
+    if loaded is None:
         print(f"❌ Kalibrasyon verisi bulunamadi: {data_path}")
         return
 
     # Veriyi yükle
-    df = pd.read_csv(data_path)
-    X = df[["eye_x","eye_y"]]
-    y = df[["screen_x","screen_y"]]
+    header, data = loaded
 
-    # Modeli eğit
-    model = LinearRegression()
-    model.fit(X, y)
+    # Aday modelleri hedef bazlı k-katlı CV ile karşılaştır, en iyisini tüm veriyle eğit
+    t0 = time.perf_counter()
+    name, mapper, report = select_model(data, k=k)
+    elapsed = (time.perf_counter() - t0) * 1000
 
-    # Modeli kaydet
-    os.makedirs(os.path.dirname(model_path), exist_ok=True)
-    joblib.dump(model, model_path)
+    # Modeli kaydet (çalışma zamanı sadece NumPy ile yükler)
+    os.makedirs(os.path.dirname(MODEL_NPZ_PATH), exist_ok=True)
+    mapper.save(MODEL_NPZ_PATH)
 
-    print(f"✅ Model egitildi ve kaydedildi: {model_path}")
-    print(f"R^2 skoru: {model.score(X, y):.4f}")
+    print(f"ℹ️ {len(data['target'])} örnek, {len(set(data['target'].tolist()))} hedef — {elapsed:.1f} ms")
+    for n, r in sorted(report.items(), key=lambda kv: kv[1]["cv_px"]):
+        mark = "👉" if n == name else "  "
+        print(f"{mark} {n:14s} CV hata {r['cv_px']:6.1f} px   p90 {r['p90_px']:6.1f} px")
+    if name in report:
+        print("Hedef bazında hata (CV):")
+        for t, sx, sy, e in report[name]["targets"]:
+            print(f"   #{t:<3d} ({sx:5.0f}, {sy:5.0f})  {e:6.1f} px")
+    print(f"✅ Model ({name}, girişler: {', '.join(mapper.inputs)}) kaydedildi: {MODEL_NPZ_PATH}")
 
 if __name__ == "__main__":
     main()
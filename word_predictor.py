@@ -0,0 +1,186 @@
+# src/word_predictor.py
+import os, mmap
+from bisect import bisect_left
+import numpy as np
+
+# Klavye için sıklık sıralı kelime tamamlama.
+# Kelimeler Türkçe büyük harf anahtarlarına göre sıralı tutulur; bir önek tüm
+# tamamlamalarıyla birlikte tek bir aralıktır → iki ikili arama ile bulunur. Aralıktaki
+# en sık k kelime np.argpartition ile seçilir ve sonuç önek bazında önbelleğe alınır.
+#
+# İki kaynak:
+#   • .tsv  → belleğe okunur (küçük sözlükler / geliştirme)
+#   • .bin  → lexicon_build.py ile önceden derlenir, mmap ile açılır; kelime başına
+#             Python nesnesi oluşturulmaz → açılış anında, RSS sözlük büyüklüğünden bağımsız
+
+LEXICON_PATH = "../data/lexicon/tr_words.tsv"   # satır başına: kelime<TAB>sıklık
+LEXICON_BIN_PATH = "../data/lexicon/tr_words.bin"
+
+# .bin düzeni (little-endian):
+#   başlık: magic "TRLX", sürüm, n, anahtar blob boyu, kelime blob boyu, ayrılmış (6 × uint32)
+#   key_off[n+1] uint32, word_off[n+1] uint32, freq[n] float32, anahtar blob, kelime blob
+# Anahtarlar UTF-8 bayt sırasına göre sıralıdır (= Python str sırası).
+LEXICON_MAGIC = b"TRLX"
+LEXICON_VERSION = 1
+HEADER = np.dtype([("magic", "S4"), ("version", "<u4"), ("n", "<u4"),
+                   ("keys_len", "<u4"), ("words_len", "<u4"), ("reserved", "<u4")])
+
+_TR_UPPER = str.maketrans({"i": "İ", "ı": "I"})
+
+
+def tr_upper(s):
+    """Türkçe kurallarıyla büyük harf (i → İ, ı → I)."""
+    return s.translate(_TR_UPPER).upper()
+
+
+def read_lexicon(path):
+    """TSV sözlüğü okur → [(kelime, sıklık), ...]. '#' ile başlayan satırlar atlanır."""
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            word, _, freq = line.partition("\t")
+            entries.append((word, float(freq) if freq else 1.0))
+    return entries
+
+
+def prefix_dict_entries(prefix_words):
+    """
+    Eski {önek: [kelimeler]} sözlüğünden giriş listesi. Bir kelime ne kadar çok önekte
+    ve ne kadar önde geçiyorsa sıklığı o kadar yüksek sayılır.
+    """
+    scores = {}
+    for words in prefix_words.values():
+        for rank, w in enumerate(words):
+            scores[w] = scores.get(w, 0.0) + 1.0 / (rank + 1)
+    return list(scores.items())
+
+
+def dedupe_entries(entries):
+    """Aynı büyük harf anahtarlı kelimelerden en sık olanı → anahtara göre sıralı [(anahtar, kelime, sıklık)]."""
+    best = {}
+    for word, freq in entries:
+        key = tr_upper(word)
+        if key not in best or freq > best[key][1]:
+            best[key] = (word, freq)
+    return [(k, best[k][0], best[k][1]) for k in sorted(best)]
+
+
+class WordPredictor:
+    """
+    complete(prefix, k) → öneki taşıyan en sık k kelime (sıklık azalan, eşitlikte alfabetik).
+    Aynı büyük harf anahtarına sahip kelimelerden en sık olanın yazımı tutulur.
+    Alt sınıflar range(), word(i) ve freqs sağlar (bkz. MappedLexicon).
+    """
+
+    CACHE_SIZE = 4096
+
+    def __init__(self, entries):
+        rows = dedupe_entries(entries)
+        self.keys = [r[0] for r in rows]
+        self.words = [r[1] for r in rows]
+        self.freqs = np.array([r[2] for r in rows], dtype=np.float64)
+        self._cache = {}
+
+    @classmethod
+    def load(cls, path=LEXICON_PATH, fallback=None):
+        """
+        Sözlüğü yükler: önce derlenmiş .bin (mmap), yoksa .tsv, o da yoksa
+        fallback ({önek: [kelimeler]}).
+        """
+        bin_path = os.path.splitext(path)[0] + ".bin"
+        if os.path.isfile(bin_path):
+            return MappedLexicon(bin_path)
+        if os.path.isfile(path):
+            return cls(read_lexicon(path))
+        return cls(prefix_dict_entries(fallback or {}))
+
+    def __len__(self):
+        return len(self.keys)
+
+    def word(self, i):
+        return self.words[i]
+
+    def range(self, prefix):
+        """Öneki taşıyan anahtarların [lo, hi) aralığı."""
+        lo = bisect_left(self.keys, prefix)
+        hi = bisect_left(self.keys, prefix + "\uffff", lo)
+        return lo, hi
+
+    def complete(self, prefix, k=10):
+        prefix = tr_upper(prefix)
+        hit = self._cache.get((prefix, k))
+        if hit is not None:
+            return hit
+
+        lo, hi = self.range(prefix)
+        f = self.freqs[lo:hi]
+        if hi - lo > k:
+            idx = np.argpartition(-f, k - 1)[:k]
+        else:
+            idx = np.arange(hi - lo)
+        # sıklık azalan, eşitlikte alfabetik (indeks sırası)
+        idx = idx[np.lexsort((idx, -f[idx]))]
+        # tuple → önbellekteki sonuç çağıran tarafından değiştirilemez
+        out = tuple(self.word(lo + i) for i in idx.tolist())
+
+        if len(self._cache) >= self.CACHE_SIZE:
+            self._cache.clear()
+        self._cache[(prefix, k)] = out
+        return out
+
+
+class MappedLexicon(WordPredictor):
+    """
+    lexicon_build.py çıktısını mmap ile açar. Diziler dosyanın üzerinde görünümdür;
+    arama sırasında sadece karşılaştırılan anahtarlar ve döndürülen kelimeler okunur.
+    """
+
+    def __init__(self, path=LEXICON_BIN_PATH):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        h = np.frombuffer(self._mm, HEADER, 1)[0]
+        if h["magic"] != LEXICON_MAGIC or h["version"] != LEXICON_VERSION:
+            raise ValueError(f"Geçersiz sözlük dosyası: {path}")
+        n = self.n = int(h["n"])
+        off = HEADER.itemsize
+        self.key_off = np.frombuffer(self._mm, "<u4", n + 1, off);  off += 4 * (n + 1)
+        self.word_off = np.frombuffer(self._mm, "<u4", n + 1, off); off += 4 * (n + 1)
+        self.freqs = np.frombuffer(self._mm, "<f4", n, off);        off += 4 * n
+        self._keys_at = off
+        self._words_at = off + int(h["keys_len"])
+        self._cache = {}
+
+    def __len__(self):
+        return self.n
+
+    def _key(self, i):
+        a = self._keys_at
+        return self._mm[a + int(self.key_off[i]):a + int(self.key_off[i + 1])]
+
+    def word(self, i):
+        a = self._words_at
+        return self._mm[a + int(self.word_off[i]):a + int(self.word_off[i + 1])].decode("utf-8")
+
+    def _bisect(self, key, lo=0):
+        hi = self.n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def range(self, prefix):
+        p = prefix.encode("utf-8")
+        lo = self._bisect(p)
+        hi = self._bisect(p + b"\xff", lo)   # 0xFF hiçbir UTF-8 dizisinde geçmez
+        return lo, hi
+
+    def close(self):
+        self.key_off = self.word_off = self.freqs = None   # mmap görünümleri bırakılmadan kapanmaz
+        self._cache.clear()
+        self._mm.close()